@@ -12,6 +12,18 @@ from app.llm.base import LLMProvider
 from .models import Chunk, ChunkMetadata
 
 
+# Fixed instruction block for semantic break detection, shared by every section prompt
+SEMANTIC_BREAK_INSTRUCTIONS = """Analyze the text below and identify good break points for chunking it into semantic units.
+
+Return positions (character indices) where natural breaks occur, such as:
+- Topic transitions
+- End of examples or lists
+- Paragraph boundaries
+- Logical conclusion points
+
+Return only numbers separated by commas, e.g.: 150, 450, 750"""
+
+
 class ChunkingStrategy(ABC):
     """Abstract base class for chunking strategies."""
 
@@ -305,21 +317,15 @@ class SmartChunkingStrategy(ChunkingStrategy):
     async def _find_semantic_breaks(self, text: str) -> list[int]:
         """Use LLM to find good break points in text."""
         try:
-            prompt = f"""Analyze this text and identify good break points for chunking into semantic units.
-            
-Text length: {len(text)} characters
+            # Instructions come first and never change, so providers that cache prompt
+            # prefixes can reuse them across sections; the section text goes last
+            prompt = f"""{SEMANTIC_BREAK_INSTRUCTIONS}
+
 Target chunk size: {self.max_chunk_size} characters
+Text length: {len(text)} characters
 
 Text:
-{text[:2000]}{"..." if len(text) > 2000 else ""}
-
-Return positions (character indices) where natural breaks occur, such as:
-- Topic transitions
-- End of examples or lists  
-- Paragraph boundaries
-- Logical conclusion points
-
-Return only numbers separated by commas, e.g.: 150, 450, 750"""
+{text[:2000]}{"..." if len(text) > 2000 else ""}"""
 
             response = await self.llm_provider.generate_response(prompt)
 
@@ -59,6 +59,7 @@ class DocumentIndexer:
         use_smart_chunking: bool = True,
         generate_embeddings: bool = True,
         batch_size: int = 10,
+        collection_metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Index a parsed document into the vector database.
 
@@ -68,6 +69,7 @@ class DocumentIndexer:
             use_smart_chunking: Whether to use LLM-assisted chunking
             generate_embeddings: Whether to generate embeddings for chunks
             batch_size: Batch size for embedding generation
+            collection_metadata: Extra collection metadata, e.g. HNSW index settings
 
         Returns:
             Dictionary with indexing statistics
@@ -111,6 +113,7 @@ class DocumentIndexer:
             "total_sections": len(document.sections),
             "chunk_count": len(chunks_with_embeddings),
             "indexing_strategy": "smart" if use_smart_chunking else "basic",
+            **(collection_metadata or {}),
         }
 
         await self.vector_db.create_collection(collection_name, collection_metadata)
@@ -148,10 +151,13 @@ class DocumentIndexer:
         return final_stats
 
     async def _generate_embeddings_batch(
-        self, chunks: list[Chunk], batch_size: int = 10
+        self, chunks: list[Chunk], batch_size: int = 10, max_inflight: int = 4
     ) -> list[Chunk]:
-        """Generate embeddings for chunks in batches with progress tracking."""
-        chunks_with_embeddings = []
+        """Generate embeddings for chunks in batches with progress tracking.
+
+        Up to max_inflight batches are sent to the provider at once so their
+        network round-trips overlap.
+        """
         total_batches = (len(chunks) + batch_size - 1) // batch_size
         
         print(f"🔢 Generating embeddings for {len(chunks)} chunks in {total_batches} batches...")
@@ -172,32 +178,34 @@ class DocumentIndexer:
             ncols=100
         )
         
+        # Batch similar-length texts together so the model pads less per batch,
+        # keeping each chunk's input position for progress reporting
+        ordered = sorted(enumerate(chunks), key=lambda item: len(self._embedding_text(item[1])))
+
         start_time = time.time()
-        successful_embeddings = 0
+        semaphore = asyncio.Semaphore(max_inflight)
+        completed_chunks = 0
 
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
+        async def worker(i: int) -> int:
+            nonlocal completed_chunks
+            batch = ordered[i : i + batch_size]
             batch_num = i // batch_size + 1
-            
-            batch_progress.set_description(f"📦 Batch {batch_num}/{total_batches}")
-            
-            # Process batch concurrently
-            embedding_tasks = [self._generate_chunk_embedding(chunk) for chunk in batch]
-            batch_results = await asyncio.gather(*embedding_tasks, return_exceptions=True)
+
+            async with semaphore:
+                batch_progress.set_description(f"📦 Batch {batch_num}/{total_batches}")
+                embeddings = await self._embed_one_batch([chunk for _, chunk in batch])
 
             # Collect successful results
-            for j, (chunk, result) in enumerate(zip(batch, batch_results)):
-                chunk_idx = i + j + 1
-                
-                if isinstance(result, Exception):
-                    logger.warning(f"Failed to generate embedding for chunk {chunk_idx}: {result}")
+            successful = 0
+            for (position, chunk), embedding in zip(batch, embeddings, strict=True):
+                chunk_idx = position + 1
+
+                if embedding is None:
                     chunk_progress.set_description(f"📄 Chunk {chunk_idx}/{len(chunks)} ❌ Error")
-                    chunks_with_embeddings.append(chunk)  # Add without embedding
                 else:
-                    chunk.embedding = result
-                    successful_embeddings += 1
+                    chunk.embedding = embedding
+                    successful += 1
                     chunk_progress.set_description(f"📄 Chunk {chunk_idx}/{len(chunks)} ✅ Done")
-                    chunks_with_embeddings.append(chunk)
                 
                 # Log individual chunk progress
                 if chunk.metadata and chunk.metadata.source_section:
@@ -208,11 +216,18 @@ class DocumentIndexer:
                 chunk_progress.update(1)
             
             batch_progress.update(1)
+            completed_chunks += len(batch)
             
             # Log batch completion with timing
             elapsed = time.time() - start_time
-            chunks_per_second = (i + len(batch)) / elapsed if elapsed > 0 else 0
+            chunks_per_second = completed_chunks / elapsed if elapsed > 0 else 0
             logger.info(f"📦 Batch {batch_num}/{total_batches} complete - {chunks_per_second:.1f} chunks/sec")
+            return successful
+
+        batch_successes = await asyncio.gather(
+            *(worker(i) for i in range(0, len(chunks), batch_size))
+        )
+        successful_embeddings = sum(batch_successes)
 
         batch_progress.close()
         chunk_progress.close()
@@ -225,27 +240,51 @@ class DocumentIndexer:
         print(f"   ⏱️  Total time: {total_time:.1f}s ({final_rate:.1f} chunks/sec)")
         print(f"   🚀 Using {self.llm_provider.__class__.__name__}")
 
-        return chunks_with_embeddings
+        # Embeddings are set on the chunks in place, so input order is preserved
+        return list(chunks)
 
-    async def _generate_chunk_embedding(self, chunk: Chunk) -> list[float] | None:
-        """Generate embedding for a single chunk."""
-        try:
-            # Use chunk content, including summary if available
-            text_to_embed = chunk.content
-            if chunk.summary:
-                text_to_embed = f"{chunk.summary}\n\n{chunk.content}"
+    async def _embed_one_batch(self, batch: list[Chunk]) -> list[list[float] | None]:
+        """Embed a batch of chunks with a single provider call.
+
+        If the batch call fails as a whole (e.g. one over-long input rejects the
+        request), each chunk is retried on its own so only the bad ones are lost.
 
-            result = await self.llm_provider.generate_embedding(text_to_embed)
+        Args:
+            batch: Chunks to embed
+
+        Returns:
+            One embedding per chunk, or None where generation failed
+        """
+        texts = [self._embedding_text(chunk) for chunk in batch]
+        try:
+            results = await self.llm_provider.generate_embeddings(texts)
+            if len(results) != len(texts):
+                raise RuntimeError(f"Expected {len(texts)} embeddings, got {len(results)}")
+        except Exception as e:
+            logger.warning(f"Failed to generate embeddings for batch, retrying per chunk: {e}")
+            results = await asyncio.gather(
+                *(self.llm_provider.generate_embedding(text) for text in texts),
+                return_exceptions=True,
+            )
 
-            if result.success and result.embedding:
-                return result.embedding
+        embeddings = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Embedding generation failed: {result}")
+                embeddings.append(None)
+            elif result.success and result.embedding:
+                embeddings.append(result.embedding)
             else:
                 logger.warning(f"Embedding generation failed: {result.error}")
-                return None
+                embeddings.append(None)
+        return embeddings
 
-        except Exception as e:
-            logger.warning(f"Exception during embedding generation: {e}")
-            return None
+    @staticmethod
+    def _embedding_text(chunk: Chunk) -> str:
+        """Get the text to embed for a chunk, including its summary if available."""
+        if chunk.summary:
+            return f"{chunk.summary}\n\n{chunk.content}"
+        return chunk.content
 
     async def search_documents(
         self,
@@ -253,6 +292,7 @@ class DocumentIndexer:
         collection_name: str = "office_documents",
         limit: int = 10,
         metadata_filter: dict[str, Any] | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[dict[str, Any]]:
         """Search for relevant document chunks.
 
@@ -261,6 +301,7 @@ class DocumentIndexer:
             collection_name: Collection to search in
             limit: Maximum number of results
             metadata_filter: Optional metadata filters
+            query_embedding: Precomputed embedding for the query (skips re-embedding)
 
         Returns:
             List of search results with content and metadata
@@ -269,15 +310,17 @@ class DocumentIndexer:
 
         # Generate embedding for query
         logger.info(f"Searching for: {query}")
-        query_result = await self.llm_provider.generate_embedding(query)
+        if query_embedding is None:
+            query_result = await self.llm_provider.generate_embedding(query)
 
-        if not query_result.success or not query_result.embedding:
-            raise RuntimeError(f"Failed to generate query embedding: {query_result.error}")
+            if not query_result.success or not query_result.embedding:
+                raise RuntimeError(f"Failed to generate query embedding: {query_result.error}")
+            query_embedding = query_result.embedding
 
         # Search vector database
         results = await self.vector_db.search(
             collection_name=collection_name,
-            query_embedding=query_result.embedding,
+            query_embedding=query_embedding,
             limit=limit,
             metadata_filter=metadata_filter,
         )
@@ -1,6 +1,7 @@
 """Google Docs client for reading and parsing documents."""
 
 import json
+import re
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,37 @@ from googleapiclient.discovery import build
 
 from app.config import get_settings
 
+# Document ID inside a Google Docs URL, and a bare 44-character document ID
+_DOC_ID_RE = re.compile(r"/document/d/([a-zA-Z0-9_-]+)")
+_BARE_ID_RE = re.compile(r"[a-zA-Z0-9_-]{44}")
+
+# Partial-response field masks for documents.get (see "fields" in the Docs API reference)
+_TEXT_RUN_FIELDS = "textRun(content,textStyle(bold,backgroundColor))"
+_PARAGRAPH_FIELDS = f"paragraph(elements({_TEXT_RUN_FIELDS}),paragraphStyle(namedStyleType))"
+_TABLE_FIELDS = "table(tableRows(tableCells(content(paragraph(elements(textRun(content)))))))"
+_BODY_FIELDS = f"body(content({_PARAGRAPH_FIELDS},{_TABLE_FIELDS}))"
+_TAB_FIELDS = f"tabProperties(tabId,title,index),documentTab({_BODY_FIELDS})"
+
+# Child tabs for the two nesting levels Docs allows below a top-level tab
+_CHILD_TAB_FIELDS = f"childTabs({_TAB_FIELDS},childTabs({_TAB_FIELDS}))"
+
+# Everything GoogleDocsParser reads, including every level of child tabs
+PARSER_FIELDS = (
+    f"documentId,revisionId,title,{_BODY_FIELDS},tabs({_TAB_FIELDS},{_CHILD_TAB_FIELDS})"
+)
+
+# Parser fields plus every tab property, for scripts that parse and inspect tabs in one fetch
+PARSER_AND_TAB_INSPECTION_FIELDS = (
+    f"documentId,revisionId,title,{_BODY_FIELDS},"
+    f"tabs(tabProperties,documentTab({_BODY_FIELDS}),{_CHILD_TAB_FIELDS})"
+)
+
+# Tab properties plus paragraph text and heading styles, for tab inspection scripts
+TAB_INSPECTION_FIELDS = (
+    "title,tabs(tabProperties,documentTab(body(content(paragraph(elements(textRun(content)),"
+    "paragraphStyle(namedStyleType))))))"
+)
+
 
 class GoogleDocsClient:
     """Client for interacting with Google Docs API."""
@@ -50,12 +82,15 @@ class GoogleDocsClient:
             self._service = build("docs", "v1", credentials=credentials)
         return self._service
 
-    def get_document(self, document_id: str, include_tabs: bool = True) -> dict[str, Any]:
+    def get_document(
+        self, document_id: str, include_tabs: bool = True, fields: str | None = None
+    ) -> dict[str, Any]:
         """Get a Google Docs document.
 
         Args:
             document_id: The ID of the Google Docs document
             include_tabs: Whether to include tab content in the response
+            fields: Optional field mask to only fetch part of the document (e.g. PARSER_FIELDS)
 
         Returns:
             Document data from Google Docs API
@@ -66,8 +101,13 @@ class GoogleDocsClient:
         try:
             service = self._get_service()
 
+            # Only request the fields the caller needs, if a mask was given
+            request_params: dict[str, Any] = {"documentId": document_id}
+            if fields:
+                request_params["fields"] = fields
+
             # Build the request with optional tab inclusion
-            request = service.documents().get(documentId=document_id)
+            request = service.documents().get(**request_params)
 
             # Include tabs content if requested
             if include_tabs:
@@ -76,7 +116,7 @@ class GoogleDocsClient:
                     print("🔍 Requesting document with all tabs content...")
                     document = (
                         service.documents()
-                        .get(documentId=document_id, includeTabsContent=True)
+                        .get(**request_params, includeTabsContent=True)
                         .execute()
                     )
 
@@ -89,7 +129,7 @@ class GoogleDocsClient:
                     print(f"⚠️  Error requesting tabs content: {tab_error}")
                     print("🔄 Falling back to basic request...")
                     # Fall back to basic request
-                    document = service.documents().get(documentId=document_id).execute()
+                    document = request.execute()
             else:
                 document = request.execute()
 
@@ -121,16 +161,13 @@ class GoogleDocsClient:
         Raises:
             ValueError: If URL format is invalid
         """
-        # Handle various Google Docs URL formats
-        if "/document/d/" in url:
-            # Format: https://docs.google.com/document/d/DOC_ID/edit
-            parts = url.split("/document/d/")
-            if len(parts) >= 2:
-                doc_id = parts[1].split("/")[0]
-                return doc_id
+        # Format: https://docs.google.com/document/d/DOC_ID/edit
+        match = _DOC_ID_RE.search(url)
+        if match:
+            return match.group(1)
 
         # If it's already just the ID
-        if len(url) == 44 and url.replace("-", "").replace("_", "").isalnum():
+        if _BARE_ID_RE.fullmatch(url):
             return url
 
         raise ValueError(f"Invalid Google Docs URL format: {url}")
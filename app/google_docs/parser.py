@@ -1,5 +1,6 @@
 """Google Docs document parser for extracting structured content."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -28,24 +29,38 @@ class DocumentSection:
 
     def get_full_text(self) -> str:
         """Get all text content from this section and subsections."""
-        text_parts = []
+        return "\n\n".join(self._iter_text_parts())
 
-        # Add section title
+    def _iter_text_parts(self) -> Iterator[str]:
+        """Yield the non-empty text parts of this section and its subsections in order."""
+        # Section title
         if self.title:
-            text_parts.append(self.title)
+            yield self.title
 
-        # Add element text
+        # Element text
         for element in self.elements:
-            if element.text.strip():
-                text_parts.append(element.text.strip())
+            if text := element.text.strip():
+                yield text
 
-        # Add subsection text recursively
+        # Subsection text, flattened so the whole tree is joined only once
         for subsection in self.subsections:
-            subsection_text = subsection.get_full_text()
-            if subsection_text.strip():
-                text_parts.append(subsection_text.strip())
+            yield from subsection._iter_text_parts()
+
+    def char_count(self) -> int:
+        """Count the characters get_full_text() returns without building the text."""
+        lengths = [len(self.title)] if self.title else []
+        lengths.extend(len(text) for element in self.elements if (text := element.text.strip()))
+        lengths.extend(
+            count for subsection in self.subsections if (count := subsection.char_count())
+        )
+        return sum(lengths) + 2 * max(len(lengths) - 1, 0)  # "\n\n" separators
 
-        return "\n\n".join(text_parts)
+    def word_count(self) -> int:
+        """Count words in this section and subsections without building the full text."""
+        count = len(self.title.split())
+        count += sum(len(element.text.split()) for element in self.elements)
+        count += sum(subsection.word_count() for subsection in self.subsections)
+        return count
 
 
 @dataclass
@@ -58,19 +73,21 @@ class ParsedDocument:
 
     def get_full_text(self) -> str:
         """Get all text content from the document."""
-        text_parts = []
-
-        # Add document title
-        if self.title:
-            text_parts.append(self.title)
+        text_parts = [self.title] if self.title else []
+        text_parts.extend(
+            part for section in self.sections for part in section._iter_text_parts()
+        )
+        return "\n\n".join(text_parts)
 
-        # Add all sections
-        for section in self.sections:
-            section_text = section.get_full_text()
-            if section_text.strip():
-                text_parts.append(section_text.strip())
+    def char_count(self) -> int:
+        """Count the characters get_full_text() returns without building the text."""
+        lengths = [len(self.title)] if self.title else []
+        lengths.extend(count for section in self.sections if (count := section.char_count()))
+        return sum(lengths) + 2 * max(len(lengths) - 1, 0)  # "\n\n" separators
 
-        return "\n\n".join(text_parts)
+    def word_count(self) -> int:
+        """Count words in the document without building the full text."""
+        return len(self.title.split()) + sum(section.word_count() for section in self.sections)
 
 
 class GoogleDocsParser:
@@ -78,19 +95,38 @@ class GoogleDocsParser:
 
     def __init__(self):
         """Initialize the parser."""
-        pass
-
-    def parse_document(self, document_data: dict[str, Any]) -> ParsedDocument:
+        # Latest (revision ID, parsed document) per document ID, field mask and tab setting
+        self._cache: dict[tuple[str, str | None, bool], tuple[str, ParsedDocument]] = {}
+
+    def parse_document(
+        self,
+        document_data: dict[str, Any],
+        fields: str | None = None,
+        include_tabs: bool = True,
+    ) -> ParsedDocument:
         """Parse a Google Docs document into structured sections.
 
+        Documents that carry a revisionId are cached per field mask and tab setting,
+        so parsing an unchanged revision fetched the same way again returns the
+        previously parsed document. That document is shared, so treat it as read-only.
+
         Args:
             document_data: Raw document data from Google Docs API
+            fields: Field mask the document was fetched with (None for the full document)
+            include_tabs: Whether the document was fetched with tab content
 
         Returns:
             Parsed document with hierarchical structure
         """
         title = document_data.get("title", "Untitled")
         document_id = document_data.get("documentId", "")
+        revision_id = document_data.get("revisionId")
+        cache_key = (document_id, fields, include_tabs)
+
+        if revision_id:
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] == revision_id:
+                return cached[1]
 
         # Check if document has tabs (newer Google Docs feature)
         if "tabs" in document_data:
@@ -106,7 +142,10 @@ class GoogleDocsParser:
         if not sections:
             sections = [DocumentSection(title="", level=0)]
 
-        return ParsedDocument(title=title, document_id=document_id, sections=sections)
+        parsed_doc = ParsedDocument(title=title, document_id=document_id, sections=sections)
+        if revision_id:
+            self._cache[cache_key] = (revision_id, parsed_doc)
+        return parsed_doc
 
     def _parse_tabbed_document(self, tabs: list[dict[str, Any]]) -> list[DocumentSection]:
         """Parse a multi-tab Google Docs document.
@@ -2,7 +2,7 @@
 
 from app.llm.anthropic import AnthropicConfig, AnthropicProvider
 from app.llm.base import LLMProvider, LLMProviderFactory
-from app.llm.factory import create_embedding_provider, create_llm_provider
+from app.llm.factory import clear_provider_cache, create_embedding_provider, create_llm_provider
 from app.llm.gemini import GeminiConfig, GeminiProvider
 from app.llm.ollama import OllamaConfig, OllamaProvider
 from app.llm.openai import OpenAIConfig, OpenAIProvider
@@ -24,6 +24,7 @@ __all__ = [
     "OllamaProvider",
     "OpenAIConfig",
     "OpenAIProvider",
+    "clear_provider_cache",
     "create_embedding_provider",
     "create_llm_provider",
 ]
@@ -135,3 +135,12 @@ Summary:"""
         except Exception as e:
             logger.warning(f"Anthropic health check failed: {e}")
             return False
+
+    async def aclose(self) -> None:
+        """Close the underlying Anthropic client and its connection pool."""
+        await self.client.close()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying Anthropic client has been closed."""
+        return self.client.is_closed()
@@ -1,6 +1,8 @@
 """Base LLM provider interface and factory pattern."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 from pydantic import BaseModel
@@ -35,6 +37,9 @@ class ResponseResult(BaseModel):
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Set by the provider factory's cache; shared instances stay open on context exit
+    _shared: bool = False
+
     @abstractmethod
     async def generate_embedding(self, text: str) -> EmbeddingResult:
         """Generate embedding for the given text.
@@ -47,6 +52,30 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def generate_embeddings(self, texts: list[str]) -> list[EmbeddingResult]:
+        """Generate embeddings for several texts.
+
+        Providers with a native batch endpoint should override this; the default
+        embeds each text concurrently, so one failing text doesn't sink the rest.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One EmbeddingResult per text, in input order; failed texts come back
+            with success=False
+        """
+        results = await asyncio.gather(
+            *(self.generate_embedding(text) for text in texts), return_exceptions=True
+        )
+        model = getattr(getattr(self, "config", None), "embedding_model", "")
+        return [
+            EmbeddingResult(embedding=[], model=model, success=False, error=str(result))
+            if isinstance(result, Exception)
+            else result
+            for result in results
+        ]
+
     @abstractmethod
     async def generate_response(self, prompt: str, context: str | None = None) -> ResponseResult:
         """Generate response given a prompt and optional context.
@@ -60,6 +89,24 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def generate_response_stream(
+        self, prompt: str, context: str | None = None
+    ) -> AsyncIterator[str]:
+        """Generate a response, yielding text as it becomes available.
+
+        Providers that support streaming should override this; the default yields
+        the complete response in one piece.
+
+        Args:
+            prompt: User prompt or question
+            context: Optional context information
+
+        Yields:
+            Pieces of the generated response, in order
+        """
+        result = await self.generate_response(prompt, context)
+        yield result.content
+
     @abstractmethod
     async def summarize(self, text: str, max_length: int = 100) -> ResponseResult:
         """Summarize the given text.
@@ -82,6 +129,24 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release pooled connections held by the provider."""
+        return None
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether aclose() has released the provider's connections."""
+        return False
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; cached providers are left open for later callers."""
+        if not self._shared:
+            await self.aclose()
+
 
 class LLMProviderFactory:
     """Factory for creating LLM providers."""
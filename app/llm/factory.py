@@ -1,13 +1,60 @@
 """Factory for creating LLM providers from configuration."""
 
+import asyncio
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
 from app.config import LLMProvider as LLMProviderEnum
 from app.config import get_settings
 from app.llm.base import LLMProvider, LLMProviderFactory
 
+# Providers built so far, keyed on provider name and serialized config. Their HTTP
+# clients are bound to the event loop they run on, so each running loop gets its own.
+_provider_cache: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], LLMProvider]
+] = WeakKeyDictionary()
+# Providers built outside a running event loop
+_loopless_provider_cache: dict[tuple[str, str], LLMProvider] = {}
+
+
+def _providers_for_running_loop() -> dict[tuple[str, str], LLMProvider]:
+    """Return the provider cache for the running event loop, if there is one."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _loopless_provider_cache
+    return _provider_cache.setdefault(loop, {})
+
+
+def _get_or_create_provider(provider_name: str, config: BaseModel) -> LLMProvider:
+    """Return the cached provider for this name and config, creating it on first use.
+
+    Cached providers are marked shared so leaving an ``async with`` block keeps them
+    open; one closed explicitly with aclose() is replaced by a fresh instance.
+    """
+    providers = _providers_for_running_loop()
+    key = (provider_name, config.model_dump_json())
+    provider = providers.get(key)
+    if provider is None or provider.is_closed:
+        provider = providers[key] = LLMProviderFactory.create(provider_name, config=config)
+        provider._shared = True
+    return provider
+
+
+def clear_provider_cache() -> None:
+    """Forget all cached providers so the next factory call builds new ones."""
+    _provider_cache.clear()
+    _loopless_provider_cache.clear()
+
 
 def create_llm_provider(provider_name: str | None = None) -> LLMProvider:
     """Create LLM provider from configuration.
 
+    Providers are cached per configuration and event loop, so repeated calls with
+    unchanged settings return the same instance and reuse its HTTP connection pool.
+    Using it as an async context manager does not close it.
+
     Args:
         provider_name: Override provider name, defaults to settings.llm_provider
 
@@ -28,7 +75,7 @@ def create_llm_provider(provider_name: str | None = None) -> LLMProvider:
             host=settings.ollama_host,
             model=settings.ollama_model,
         )
-        return LLMProviderFactory.create("ollama", config=config)
+        return _get_or_create_provider("ollama", config)
 
     elif provider_name == LLMProviderEnum.OPENAI:
         from app.llm.openai import OpenAIConfig
@@ -37,7 +84,7 @@ def create_llm_provider(provider_name: str | None = None) -> LLMProvider:
             raise ValueError("OpenAI API key is required")
 
         config = OpenAIConfig(api_key=settings.openai_api_key)
-        return LLMProviderFactory.create("openai", config=config)
+        return _get_or_create_provider("openai", config)
 
     elif provider_name == LLMProviderEnum.GEMINI:
         from app.llm.gemini import GeminiConfig
@@ -49,7 +96,7 @@ def create_llm_provider(provider_name: str | None = None) -> LLMProvider:
             api_key=settings.gemini_api_key,
             model=settings.gemini_model,
         )
-        return LLMProviderFactory.create("gemini", config=config)
+        return _get_or_create_provider("gemini", config)
 
     elif provider_name == LLMProviderEnum.ANTHROPIC:
         from app.llm.anthropic import AnthropicConfig
@@ -58,7 +105,7 @@ def create_llm_provider(provider_name: str | None = None) -> LLMProvider:
             raise ValueError("Anthropic API key is required")
 
         config = AnthropicConfig(api_key=settings.anthropic_api_key)
-        return LLMProviderFactory.create("anthropic", config=config)
+        return _get_or_create_provider("anthropic", config)
 
     else:
         raise ValueError(f"Unknown LLM provider: {provider_name}")
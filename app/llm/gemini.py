@@ -1,5 +1,6 @@
 """Google Gemini LLM provider implementation."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -46,7 +47,9 @@ class GeminiProvider(LLMProvider):
             EmbeddingResult with embedding vector
         """
         try:
-            result = genai.embed_content(
+            # The Gemini SDK is synchronous, so keep it off the event loop
+            result = await asyncio.to_thread(
+                genai.embed_content,
                 model=self.config.embedding_model,
                 content=text,
                 task_type="retrieval_document",
@@ -78,7 +81,8 @@ class GeminiProvider(LLMProvider):
             full_prompt = f"Context: {context}\n\nQuestion: {prompt}"
 
         try:
-            response = self.model.generate_content(
+            response = await asyncio.to_thread(
+                self.model.generate_content,
                 full_prompt,
                 generation_config=genai.types.GenerationConfig(
                     max_output_tokens=self.config.max_tokens,
@@ -127,7 +131,8 @@ Summary:"""
         """
         try:
             # Try a simple embedding request to test connectivity
-            genai.embed_content(
+            await asyncio.to_thread(
+                genai.embed_content,
                 model=self.config.embedding_model,
                 content="health check",
             )
@@ -1,7 +1,9 @@
 """Ollama LLM provider implementation."""
 
 import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -11,6 +13,9 @@ from app.llm.base import EmbeddingResult, LLMProvider, ResponseResult
 
 logger = logging.getLogger(__name__)
 
+# Keep connections to the Ollama server alive between embedding and generation calls
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
 
 class OllamaConfig(BaseModel):
     """Configuration for Ollama provider."""
@@ -35,7 +40,8 @@ class OllamaProvider(LLMProvider):
         self.config = config or OllamaConfig(**kwargs)
         self.client = httpx.AsyncClient(
             base_url=self.config.host,
-            timeout=self.config.timeout,
+            limits=_HTTP_LIMITS,
+            timeout=httpx.Timeout(self.config.timeout, connect=5.0),
         )
 
     async def generate_embedding(self, text: str) -> EmbeddingResult:
@@ -74,6 +80,52 @@ class OllamaProvider(LLMProvider):
             logger.error(f"Ollama embedding HTTP error: {e}")
             raise RuntimeError(f"Ollama API error: {e}")
 
+    async def generate_embeddings(
+        self, texts: list[str], batch_size: int = 100
+    ) -> list[EmbeddingResult]:
+        """Generate embeddings for several texts, sending up to batch_size per request.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum number of texts per /api/embed request
+
+        Returns:
+            One EmbeddingResult per text, in input order
+        """
+        results = []
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i : i + batch_size]
+            try:
+                response = await self.client.post(
+                    "/api/embed",
+                    json={
+                        "model": self.config.embedding_model,
+                        "input": batch,
+                    },
+                )
+                response.raise_for_status()
+                data = response.json()
+
+            except httpx.RequestError as e:
+                logger.error(f"Ollama batch embedding request failed: {e}")
+                raise RuntimeError(f"Failed to generate embeddings: {e}") from e
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Ollama batch embedding HTTP error: {e}")
+                raise RuntimeError(f"Ollama API error: {e}") from e
+
+            embeddings = data.get("embeddings", [])
+            if len(embeddings) != len(batch):
+                raise RuntimeError(
+                    f"Ollama returned {len(embeddings)} embeddings for {len(batch)} texts"
+                )
+
+            results.extend(
+                EmbeddingResult(embedding=embedding, model=self.config.embedding_model)
+                for embedding in embeddings
+            )
+
+        return results
+
     async def generate_response(self, prompt: str, context: str | None = None) -> ResponseResult:
         """Generate response using Ollama's chat model.
 
@@ -137,6 +189,66 @@ class OllamaProvider(LLMProvider):
             logger.error(f"Model: {self.config.model}, Host: {self.config.host}")
             raise RuntimeError(f"Unexpected error: {e}")
 
+    async def generate_response_stream(
+        self, prompt: str, context: str | None = None
+    ) -> AsyncIterator[str]:
+        """Stream a response from Ollama's chat model as tokens are generated.
+
+        Args:
+            prompt: User prompt or question
+            context: Optional context information
+
+        Yields:
+            Pieces of the generated response, in order
+        """
+        full_prompt = prompt
+        if context:
+            full_prompt = f"Context: {context}\n\nQuestion: {prompt}"
+
+        try:
+            async with self.client.stream(
+                "POST",
+                "/api/generate",
+                json={
+                    "model": self.config.model,
+                    "prompt": full_prompt,
+                    "stream": True,
+                },
+                timeout=180.0,
+            ) as response:
+                response.raise_for_status()
+                # Ollama streams one JSON object per line until "done" is set
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise RuntimeError(f"Invalid JSON in Ollama stream: {line[:200]}") from e
+                    # Errors after the stream starts arrive as a payload, not a status code
+                    if "error" in data:
+                        raise RuntimeError(f"Ollama API error: {data['error']}")
+                    if data.get("response"):
+                        yield data["response"]
+                    if data.get("done"):
+                        break
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Ollama streaming request timed out after 180s: {e}")
+            raise RuntimeError(f"Ollama request timed out: {e}") from e
+        except httpx.RequestError as e:
+            logger.error(f"Ollama streaming request failed: {e}")
+            raise RuntimeError(f"Failed to generate response: {e}") from e
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ollama streaming HTTP error: {e}")
+            raise RuntimeError(f"Ollama API error: {e}") from e
+        except RuntimeError as e:
+            logger.error(f"Ollama streaming failed: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in Ollama generate_response_stream: {e}")
+            raise RuntimeError(f"Unexpected error: {e}") from e
+
     async def summarize(self, text: str, max_length: int = 100) -> ResponseResult:
         """Summarize text using Ollama.
 
@@ -227,10 +339,11 @@ Summary:"""
             logger.error(f"Failed to pull model {model}: {e}")
             raise RuntimeError(f"Failed to pull model {model}: {e}")
 
-    async def __aenter__(self):
-        """Async context manager entry."""
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
         await self.client.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying HTTP client has been closed."""
+        return self.client.is_closed
@@ -67,6 +67,43 @@ class OpenAIProvider(LLMProvider):
             logger.error(f"OpenAI embedding request failed: {e}")
             raise RuntimeError(f"Failed to generate embedding: {e}")
 
+    async def generate_embeddings(
+        self, texts: list[str], batch_size: int = 100
+    ) -> list[EmbeddingResult]:
+        """Generate embeddings for several texts, sending up to batch_size per request.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum number of texts per embeddings request
+
+        Returns:
+            One EmbeddingResult per text, in input order
+        """
+        results = []
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i : i + batch_size]
+            try:
+                response = await self.client.embeddings.create(
+                    model=self.config.embedding_model,
+                    input=batch,
+                )
+            except openai.OpenAIError as e:
+                logger.error(f"OpenAI batch embedding request failed: {e}")
+                raise RuntimeError(f"Failed to generate embeddings: {e}") from e
+
+            if len(response.data) != len(batch):
+                raise RuntimeError(
+                    f"OpenAI returned {len(response.data)} embeddings for {len(batch)} texts"
+                )
+
+            # Token usage is only reported for the whole request, not per input
+            results.extend(
+                EmbeddingResult(embedding=item.embedding, model=self.config.embedding_model)
+                for item in sorted(response.data, key=lambda item: item.index)
+            )
+
+        return results
+
     async def generate_response(self, prompt: str, context: str | None = None) -> ResponseResult:
         """Generate response using OpenAI's chat model.
 
@@ -144,3 +181,12 @@ Summary:"""
         except Exception as e:
             logger.warning(f"OpenAI health check failed: {e}")
             return False
+
+    async def aclose(self) -> None:
+        """Close the underlying OpenAI client and its connection pool."""
+        await self.client.close()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying OpenAI client has been closed."""
+        return self.client.is_closed()
@@ -12,6 +12,14 @@ from .models import QueryContext, QueryResult, SearchResult
 
 logger = logging.getLogger(__name__)
 
+# Query cleanup patterns, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_USER_MENTION_RE = re.compile(r'<@[A-Z0-9]+>')
+_CHANNEL_MENTION_RE = re.compile(r'<#[A-Z0-9]+\|[^>]+>')
+_LINK_RE = re.compile(r'<http[^>]+>')
+_BOT_MENTION_RE = re.compile(r'@\w+')
+_DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\?\!\.\,\-]')
+
 
 class QueryProcessor:
     """Handles query processing with RAG (Retrieval Augmented Generation)."""
@@ -52,19 +60,19 @@ class QueryProcessor:
             Cleaned query string
         """
         # Remove extra whitespace
-        query = re.sub(r'\s+', ' ', query.strip())
+        query = _WHITESPACE_RE.sub(' ', query.strip())
         
         # Remove common Slack formatting
-        query = re.sub(r'<@[A-Z0-9]+>', '', query)  # Remove user mentions
-        query = re.sub(r'<#[A-Z0-9]+\|[^>]+>', '', query)  # Remove channel mentions
-        query = re.sub(r'<http[^>]+>', '', query)  # Remove links
+        query = _USER_MENTION_RE.sub('', query)  # Remove user mentions
+        query = _CHANNEL_MENTION_RE.sub('', query)  # Remove channel mentions
+        query = _LINK_RE.sub('', query)  # Remove links
         
         # Remove bot mention patterns
-        query = re.sub(r'@\w+', '', query)
+        query = _BOT_MENTION_RE.sub('', query)
         
         # Clean up punctuation and formatting
-        query = re.sub(r'[^\w\s\?\!\.\,\-]', ' ', query)
-        query = re.sub(r'\s+', ' ', query.strip())
+        query = _DISALLOWED_CHARS_RE.sub(' ', query)
+        query = _WHITESPACE_RE.sub(' ', query.strip())
         
         return query
 
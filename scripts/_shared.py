@@ -0,0 +1,271 @@
+"""Shared helpers for the debug and validation scripts."""
+
+import asyncio
+import hashlib
+import json
+import pickle
+import shelve
+import time
+from collections.abc import Coroutine
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.google_docs import GoogleDocsClient, GoogleDocsParser, ParsedDocument
+from app.google_docs.client import PARSER_FIELDS
+
+# ChromaDB, the indexer and the LLM providers are slow to import, so they are only
+# imported by the helpers that need them; Docs-only scripts never pay for them
+if TYPE_CHECKING:
+    from chromadb import Collection
+    from chromadb.api import ClientAPI
+
+    from app.embedding import DocumentIndexer
+    from app.embedding.vectorizer import ChromaVectorDatabase
+    from app.llm.base import LLMProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    uvloop = None
+
+CACHE_DIR = Path(".cache")
+
+# Where the validation scripts expect the service account key
+DEFAULT_CREDENTIALS_PATH = Path("credentials/google-docs-service-account.json")
+
+_llm_provider: "LLMProvider | None" = None
+
+# HNSW settings for validation collections, which are searched far more than they are built.
+# The distance metric is left at Chroma's l2 default to match the production collection.
+HNSW_METADATA = {
+    "hnsw:construction_ef": 128,
+    "hnsw:M": 24,
+    "hnsw:search_ef": 100,
+}
+
+# Query embeddings persisted across runs, keyed on provider, model and text
+EMBEDDING_CACHE_PATH = CACHE_DIR / "query-embeddings"
+
+# Bound once so the stdlib fallback doesn't rebuild an encoder on every dump
+_encode_json = json.JSONEncoder(indent=2).encode
+
+
+def run_async(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a script's entrypoint coroutine, on uvloop when it is installed.
+
+    Args:
+        main: Coroutine to run to completion
+
+    Returns:
+        Whatever the coroutine returns
+    """
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
+
+
+def dump_json(data: object) -> str:
+    """Pretty-print data as JSON with a two-space indent, using orjson when installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Indented JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return _encode_json(data)
+
+
+def write_json(path: Path, data: object) -> None:
+    """Write data to a file as indented JSON, using orjson when installed.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with path.open("w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_or_fetch(
+    docs_client: GoogleDocsClient,
+    parser: GoogleDocsParser,
+    doc_id: str,
+    ttl: int = 3600,
+) -> ParsedDocument:
+    """Load a parsed document from the local cache, fetching it if missing or stale.
+
+    Args:
+        docs_client: Google Docs client used on a cache miss
+        parser: Parser used on a cache miss
+        doc_id: Google Docs document ID
+        ttl: Maximum age of the cached document in seconds
+
+    Returns:
+        Parsed document
+    """
+    cache_path = CACHE_DIR / f"doc-{doc_id}.pkl"
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < ttl:
+        print(f"💾 Using cached document: {cache_path}")
+        with cache_path.open("rb") as f:
+            return pickle.load(f)
+
+    document = docs_client.get_document(doc_id, fields=PARSER_FIELDS)
+    parsed_doc = parser.parse_document(document, fields=PARSER_FIELDS)
+
+    # Write to a temp file first so a crash never leaves a truncated cache behind
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with tmp_path.open("wb") as f:
+        pickle.dump(parsed_doc, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(cache_path)
+
+    return parsed_doc
+
+
+def cached_get_document(
+    docs_client: GoogleDocsClient, doc_id: str, ttl: int = 3600, fields: str | None = None
+) -> dict[str, Any]:
+    """Get the raw Google Docs JSON for a document, cached on disk between runs.
+
+    Args:
+        docs_client: Google Docs client used on a cache miss
+        doc_id: Google Docs document ID
+        ttl: Maximum age of the cached response in seconds
+        fields: Optional field mask; each mask is cached separately
+
+    Returns:
+        Document data from the Google Docs API
+    """
+    cache_name = doc_id
+    if fields:
+        cache_name += "-" + hashlib.sha1(fields.encode()).hexdigest()[:12]
+    cache_path = CACHE_DIR / "docs" / f"{cache_name}.json"
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < ttl:
+        print(f"💾 Using cached document JSON: {cache_path}")
+        with cache_path.open() as f:
+            return json.load(f)
+
+    document = docs_client.get_document(doc_id, fields=fields)
+
+    # Write to a temp file first so a crash never leaves a truncated cache behind
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with tmp_path.open("w") as f:
+        json.dump(document, f)
+    tmp_path.replace(cache_path)
+
+    return document
+
+
+def _open_embedding_store() -> shelve.Shelf:
+    """Open the on-disk query embedding cache; callers close it with a with-block."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    return shelve.open(str(EMBEDDING_CACHE_PATH))
+
+
+async def embed_queries(provider: "LLMProvider", texts: list[str]) -> list[list[float]]:
+    """Embed queries, reusing vectors from earlier runs and batching the rest in one call.
+
+    Args:
+        provider: Provider used for texts not yet cached
+        texts: Query texts to embed
+
+    Returns:
+        Embedding vectors in the same order as texts
+
+    Raises:
+        RuntimeError: If the provider fails to generate an embedding
+    """
+    model = getattr(getattr(provider, "config", None), "embedding_model", "")
+    keys = [f"{type(provider).__name__}:{model}:{text}" for text in texts]
+    with _open_embedding_store() as store:
+        vectors = {key: store[key] for key in keys if key in store}
+
+    misses = {key: text for key, text in zip(keys, texts, strict=True) if key not in vectors}
+    if misses:
+        results = await provider.generate_embeddings(list(misses.values()))
+        if len(results) != len(misses):
+            raise RuntimeError(f"Expected {len(misses)} query embeddings, got {len(results)}")
+        for key, result in zip(misses, results, strict=True):
+            if not result.success or not result.embedding:
+                raise RuntimeError(f"Failed to generate query embedding: {result.error}")
+            vectors[key] = result.embedding
+
+        with _open_embedding_store() as store:
+            for key in misses:
+                store[key] = vectors[key]
+
+    return [vectors[key] for key in keys]
+
+
+@lru_cache(maxsize=None)
+def get_docs_client(service_account_path: Path = DEFAULT_CREDENTIALS_PATH) -> GoogleDocsClient:
+    """Get a Google Docs client, reusing its credentials and API service across lookups.
+
+    Args:
+        service_account_path: Path to service account credentials JSON file
+
+    Returns:
+        Google Docs client
+    """
+    return GoogleDocsClient(service_account_path=service_account_path)
+
+
+async def get_llm_provider() -> "LLMProvider":
+    """Get the configured LLM provider, creating it on first use."""
+    global _llm_provider
+    if _llm_provider is None:
+        from app.llm.base import create_llm_provider
+
+        _llm_provider = await create_llm_provider()
+    return _llm_provider
+
+
+@lru_cache(maxsize=1)
+def get_vector_db() -> "ChromaVectorDatabase":
+    """Get the ChromaDB wrapper shared by everything in this process."""
+    from app.embedding.vectorizer import ChromaVectorDatabase
+
+    return ChromaVectorDatabase()
+
+
+@lru_cache(maxsize=1)
+def get_indexer() -> "DocumentIndexer":
+    """Get a document indexer whose vector DB and embedding provider are shared process-wide."""
+    from app.embedding import DocumentIndexer
+    from app.llm.factory import create_embedding_provider
+
+    return DocumentIndexer(vector_db=get_vector_db(), llm_provider=create_embedding_provider())
+
+
+def get_chroma_client() -> "ClientAPI":
+    """Get the raw ChromaDB HTTP client behind the shared vector database."""
+    return get_vector_db().client
+
+
+@lru_cache(maxsize=None)
+def get_collection(name: str) -> "Collection":
+    """Get a ChromaDB collection handle, reusing it across lookups.
+
+    Only call this after the collection has been (re)created, since the handle is
+    cached for the lifetime of the process.
+
+    Args:
+        name: Collection name
+
+    Returns:
+        ChromaDB collection
+    """
+    return get_chroma_client().get_collection(name)
@@ -1,10 +1,13 @@
 """Debug script to see what happens during tab parsing."""
 
-import asyncio
 import logging
+import sys
+from collections import Counter
+from itertools import islice
 
 from app.config import get_settings
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs import GoogleDocsClient, GoogleDocsParser, ParsedDocument
+from scripts._shared import load_or_fetch, run_async
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -13,6 +16,51 @@ logging.getLogger("httpcore").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+def inspect_tab_parsing(parsed_doc: ParsedDocument) -> None:
+    """Print how parsed sections are distributed across tabs.
+
+    Args:
+        parsed_doc: Parsed document to inspect
+    """
+    print(f"📑 Document: {parsed_doc.title}")
+    print(f"📊 Total sections: {len(parsed_doc.sections)}")
+
+    # Check first few sections to see their tab info
+    print(f"\n📋 First 10 sections and their tab info:")
+    for i, section in enumerate(parsed_doc.sections[:10]):
+        lines = [
+            f"   Section {i+1}: '{section.title}'",
+            f"      tab_title: '{section.tab_title}'",
+            f"      tab_id: '{section.tab_id}'",
+            f"      level: {section.level}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    # Count sections by tab
+    tab_counts = Counter(section.tab_title for section in parsed_doc.sections)
+    empty_tab_count = tab_counts.pop("", 0)
+
+    print(f"\n📊 Sections by tab:")
+    sys.stdout.write(
+        "".join(f"   '{tab_name}': {count} sections\n" for tab_name, count in tab_counts.items())
+    )
+
+    if empty_tab_count:
+        print(f"   ❌ Empty tab_title: {empty_tab_count} sections")
+
+    # Check some sections with empty tab titles
+    print(f"\n🔍 First 5 sections with empty tab_title:")
+    empty_sections = (
+        (i, section) for i, section in enumerate(parsed_doc.sections) if not section.tab_title
+    )
+    sys.stdout.write(
+        "".join(
+            f"   Section {i+1}: '{section.title}' (level {section.level})\n"
+            for i, section in islice(empty_sections, 5)
+        )
+    )
+
+
 async def debug_tab_parsing():
     """Debug tab parsing to see where tab names get lost."""
     print("🐛 Debugging Tab Parsing")
@@ -27,50 +75,11 @@ async def debug_tab_parsing():
         )
         docs_parser = GoogleDocsParser()
         
-        # Fetch document
+        # Fetch and parse document (cached between runs)
         print("📥 Fetching document...")
-        document = docs_client.get_document(settings.google_docs_id)
-        
-        print(f"📑 Document: {document.get('title', 'No title')}")
-        
-        # Parse document and check what we get
-        print("\n🔍 Parsing document...")
-        parsed_doc = docs_parser.parse_document(document)
-        
-        print(f"📊 Total sections: {len(parsed_doc.sections)}")
-        
-        # Check first few sections to see their tab info
-        print(f"\n📋 First 10 sections and their tab info:")
-        for i, section in enumerate(parsed_doc.sections[:10]):
-            print(f"   Section {i+1}: '{section.title}'")
-            print(f"      tab_title: '{section.tab_title}'")
-            print(f"      tab_id: '{section.tab_id}'")
-            print(f"      level: {section.level}")
-            
-        # Count sections by tab
-        tab_counts = {}
-        empty_tab_count = 0
-        
-        for section in parsed_doc.sections:
-            if section.tab_title:
-                tab_counts[section.tab_title] = tab_counts.get(section.tab_title, 0) + 1
-            else:
-                empty_tab_count += 1
-        
-        print(f"\n📊 Sections by tab:")
-        for tab_name, count in tab_counts.items():
-            print(f"   '{tab_name}': {count} sections")
-        
-        if empty_tab_count:
-            print(f"   ❌ Empty tab_title: {empty_tab_count} sections")
-            
-        # Check some sections with empty tab titles
-        print(f"\n🔍 First 5 sections with empty tab_title:")
-        empty_count = 0
-        for i, section in enumerate(parsed_doc.sections):
-            if not section.tab_title and empty_count < 5:
-                print(f"   Section {i+1}: '{section.title}' (level {section.level})")
-                empty_count += 1
+        parsed_doc = load_or_fetch(docs_client, docs_parser, settings.google_docs_id)
+
+        inspect_tab_parsing(parsed_doc)
         
     except Exception as e:
         print(f"❌ Debug failed: {e}")
@@ -79,4 +88,4 @@ async def debug_tab_parsing():
 
 
 if __name__ == "__main__":
-    asyncio.run(debug_tab_parsing())
\ No newline at end of file
+    run_async(debug_tab_parsing())
\ No newline at end of file
@@ -1,8 +1,39 @@
 """Debug script to see Google Docs tab structure."""
 
-import json
+from typing import Any
+
 from app.config import get_settings
 from app.google_docs import GoogleDocsClient
+from app.google_docs.client import TAB_INSPECTION_FIELDS
+from scripts._shared import dump_json
+
+
+def inspect_tab_structure(document: dict[str, Any]) -> None:
+    """Print the raw structure of the first few tabs, looking for ID fields.
+
+    Args:
+        document: Raw Google Docs document with tabs
+    """
+    if "tabs" in document:
+        print(f"📑 Found {len(document['tabs'])} tabs")
+
+        for i, tab in enumerate(document["tabs"][:3]):  # Show first 3 tabs
+            print(f"\n📂 Tab {i+1} structure:")
+            print(f"Keys: {list(tab.keys())}")
+
+            if "tabProperties" in tab:
+                print(f"tabProperties keys: {list(tab['tabProperties'].keys())}")
+                print(f"tabProperties: {dump_json(tab['tabProperties'])}")
+
+            # Look for any ID-like fields
+            for key, value in tab.items():
+                if 'id' in key.lower():
+                    print(f"ID field found: {key} = {value}")
+
+            print("-" * 30)
+    else:
+        print("❌ No tabs found in document")
+
 
 def debug_tab_structure():
     """Debug the structure of tabs to find ID fields."""
@@ -19,27 +50,11 @@ def debug_tab_structure():
         
         # Fetch document with tabs
         print(f"📥 Fetching document: {settings.google_docs_id}")
-        document = docs_client.get_document(settings.google_docs_id, include_tabs=True)
+        document = docs_client.get_document(
+            settings.google_docs_id, include_tabs=True, fields=TAB_INSPECTION_FIELDS
+        )
         
-        if "tabs" in document:
-            print(f"📑 Found {len(document['tabs'])} tabs")
-            
-            for i, tab in enumerate(document["tabs"][:3]):  # Show first 3 tabs
-                print(f"\n📂 Tab {i+1} structure:")
-                print(f"Keys: {list(tab.keys())}")
-                
-                if "tabProperties" in tab:
-                    print(f"tabProperties keys: {list(tab['tabProperties'].keys())}")
-                    print(f"tabProperties: {json.dumps(tab['tabProperties'], indent=2)}")
-                
-                # Look for any ID-like fields
-                for key, value in tab.items():
-                    if 'id' in key.lower():
-                        print(f"ID field found: {key} = {value}")
-                        
-                print("-" * 30)
-        else:
-            print("❌ No tabs found in document")
+        inspect_tab_structure(document)
             
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -1,11 +1,11 @@
 """Script to inspect what's stored in the vector database."""
 
-import asyncio
 import json
 import logging
 
 from app.config import get_settings
-from app.embedding.vectorizer import ChromaVectorDatabase
+from app.llm.factory import create_embedding_provider
+from scripts._shared import embed_queries, get_collection, get_vector_db, run_async
 
 # Set up logging - silence httpx spam but keep our logs
 logging.basicConfig(level=logging.INFO)
@@ -13,6 +13,9 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Queries used to probe search quality; all of them go to Chroma in one request
+DEBUG_QUERIES = ["demand forecasting", "pricing", "supply and dispatch"]
+
 
 async def inspect_vector_db():
     """Inspect the vector database contents."""
@@ -21,7 +24,7 @@ async def inspect_vector_db():
     
     try:
         # Initialize vector database
-        vector_db = ChromaVectorDatabase()
+        vector_db = get_vector_db()
         
         # Get collection stats
         collection_name = "document_chunks"
@@ -39,12 +42,10 @@ async def inspect_vector_db():
         
         # Try to get the collection directly to inspect structure
         try:
-            import chromadb
-            chroma_client = chromadb.HttpClient(host="localhost", port=8000)
-            collection = chroma_client.get_collection(collection_name)
+            collection = get_collection(collection_name)
             
             # Get a few documents without doing similarity search
-            result = collection.peek(limit=5)
+            result = collection.get(limit=5, include=["documents", "metadatas"])
             
             if result and 'documents' in result:
                 for i, (doc, metadata) in enumerate(zip(result['documents'], result.get('metadatas', []))):
@@ -58,51 +59,46 @@ async def inspect_vector_db():
                 
         except Exception as e:
             print(f"Failed to peek at collection: {e}")
-            # Fallback: try with correct embedding dimension (768 for Gemini)
-            sample_results = await vector_db.search(
-                collection_name=collection_name,
-                query_embedding=[0.1] * 768,  # Try 768 dimensions
-                limit=5
-            )
-        
-        for i, result in enumerate(sample_results, 1):
-            print(f"\n🔖 Chunk {i}:")
-            print(f"   Content (first 100 chars): {result['content'][:100]}...")
-            print(f"   Distance: {result.get('distance', 'N/A')}")
             
-            # Print metadata in a readable format
-            metadata = result.get('metadata', {})
-            print(f"   Metadata:")
-            for key, value in metadata.items():
-                print(f"      {key}: {value}")
-                
-        # Test a specific search for "demand forecasting"
+        # Probe the collection with a few debug queries in a single Chroma round-trip
         print("\n" + "=" * 60)
-        print("🔍 Testing Search for 'demand forecasting':")
+        print(f"🔍 Testing Search for {', '.join(repr(q) for q in DEBUG_QUERIES)}:")
         print("-" * 40)
-        
-        # First generate embedding for the query
-        from app.llm.base import create_llm_provider
-        llm_provider = await create_llm_provider()
-        query_result = await llm_provider.generate_embedding("demand forecasting")
-        
-        if query_result.success:
-            search_results = await vector_db.search(
-                collection_name=collection_name,
-                query_embedding=query_result.embedding,
-                limit=3
-            )
-            
-            for i, result in enumerate(search_results, 1):
-                print(f"\n📄 Result {i} (distance: {result.get('distance', 'N/A'):.3f}):")
-                print(f"   Content: {result['content'][:200]}...")
-                
-                metadata = result.get('metadata', {})
+
+        # First embed all queries with one provider call; the provider is cached
+        # and shared, so it is left open
+        try:
+            query_embeddings = await embed_queries(create_embedding_provider(), DEBUG_QUERIES)
+        except RuntimeError as e:
+            print(f"❌ Failed to generate embedding: {e}")
+            return
+
+        results = get_collection(collection_name).query(
+            query_embeddings=query_embeddings,
+            n_results=3,
+            include=["documents", "metadatas", "distances"],
+        )
+
+        for query, documents, metadatas, distances in zip(
+            DEBUG_QUERIES,
+            results["documents"],
+            results["metadatas"],
+            results["distances"],
+            strict=True,
+        ):
+            print(f"\n🔎 Query: '{query}'")
+            for i, (content, metadata, distance) in enumerate(
+                zip(documents, metadatas, distances, strict=True), 1
+            ):
+                print(f"\n📄 Result {i} (distance: {distance:.3f}):")
+                print(f"   Content: {content[:200]}...")
+
+                metadata = metadata or {}
                 print(f"   Tab: {metadata.get('source_tab', 'N/A')}")
                 print(f"   Tab ID: {metadata.get('source_tab_id', 'N/A')}")
                 print(f"   Section: {metadata.get('source_section', 'N/A')}")
                 print(f"   Document ID: {metadata.get('source_document_id', 'N/A')}")
-                
+
                 # Show what the URL would be
                 doc_id = metadata.get('source_document_id')
                 tab_id = metadata.get('source_tab_id')
@@ -111,9 +107,7 @@ async def inspect_vector_db():
                     print(f"   Generated URL: {url}")
                 else:
                     print(f"   ❌ Missing data for URL generation")
-        else:
-            print(f"❌ Failed to generate embedding: {query_result.error}")
-        
+
     except Exception as e:
         print(f"❌ Inspection failed: {e}")
         import traceback
@@ -121,4 +115,4 @@ async def inspect_vector_db():
 
 
 if __name__ == "__main__":
-    asyncio.run(inspect_vector_db())
\ No newline at end of file
+    run_async(inspect_vector_db())
\ No newline at end of file
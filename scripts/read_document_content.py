@@ -1,15 +1,68 @@
 """Read and display Google Doc content for analysis."""
 
 import logging
+import re
+import sys
 from pathlib import Path
 
 from app.config import get_settings
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs import GoogleDocsClient, GoogleDocsParser, ParsedDocument
+from scripts._shared import load_or_fetch
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Section titles likely to describe the product as a whole
+KEY_SECTION_RE = re.compile(r"purpose|overview|introduction|getting started|features", re.I)
+
+
+def print_document_content(parsed_doc: ParsedDocument) -> None:
+    """Print previews of the first sections and any key sections.
+
+    Args:
+        parsed_doc: Parsed document to display
+    """
+    print(f"📑 Document: {parsed_doc.title}")
+    print(f"📊 Found {len(parsed_doc.sections)} total sections")
+    print("\n" + "=" * 50)
+
+    # Show first few sections to understand structure, one write per section
+    for i, section in enumerate(parsed_doc.sections[:10]):
+        content = section.get_full_text()
+        lines = [
+            f"\n📄 Section {i+1}: {section.title}",
+            f"Level: {section.level}",
+            f"Content ({len(content)} chars):",
+        ]
+
+        # Show first 400 characters of content
+        if len(content) > 400:
+            lines.append(f"   {content[:400]}...")
+            lines.append(f"   [... {len(content) - 400} more characters]")
+        else:
+            lines.append(f"   {content}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    # Show some key sections that might contain company info
+    print("\n" + "=" * 50)
+    print("🔍 Looking for key sections...")
+
+    # Collect every key section and write them in one go
+    lines = []
+    for section in parsed_doc.sections:
+        if KEY_SECTION_RE.search(section.title):
+            lines.append(f"\n📍 KEY SECTION: {section.title}")
+            content = section.get_full_text()
+            lines.append(f"   Content: {content[:500]}...")
+            if len(content) > 500:
+                lines.append(f"   [... {len(content) - 500} more characters]")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    print("\n" + "=" * 50)
+    print("✅ Document content displayed above")
+
 
 def read_document_content():
     """Read the Google Doc and display its content."""
@@ -28,47 +81,9 @@ def read_document_content():
         
         # Fetch document
         print(f"📥 Fetching document: {settings.google_docs_id}")
-        document = docs_client.get_document(settings.google_docs_id)
-        parsed_doc = docs_parser.parse_document(document)
-        
-        print(f"📑 Document: {parsed_doc.title}")
-        print(f"📊 Found {len(parsed_doc.sections)} total sections")
-        print("\n" + "=" * 50)
-        
-        # Show first few sections to understand structure
-        for i, section in enumerate(parsed_doc.sections[:10]):
-            print(f"\n📄 Section {i+1}: {section.title}")
-            print(f"Level: {section.level}")
-            
-            # Get section content
-            content = section.get_full_text()
-            print(f"Content ({len(content)} chars):")
-            
-            # Show first 400 characters of content
-            preview = content[:400]
-            if len(content) > 400:
-                preview += "..."
-                
-            print(f"   {preview}")
-            
-            if len(content) > 400:
-                print(f"   [... {len(content) - 400} more characters]")
-        
-        # Show some key sections that might contain company info
-        print("\n" + "=" * 50)
-        print("🔍 Looking for key sections...")
-        
-        for section in parsed_doc.sections:
-            title_lower = section.title.lower()
-            if any(keyword in title_lower for keyword in ['purpose', 'overview', 'introduction', 'getting started', 'features']):
-                print(f"\n📍 KEY SECTION: {section.title}")
-                content = section.get_full_text()
-                print(f"   Content: {content[:500]}...")
-                if len(content) > 500:
-                    print(f"   [... {len(content) - 500} more characters]")
+        parsed_doc = load_or_fetch(docs_client, docs_parser, settings.google_docs_id)
         
-        print("\n" + "=" * 50)
-        print("✅ Document content displayed above")
+        print_document_content(parsed_doc)
         
     except Exception as e:
         print(f"❌ Error reading document: {e}")
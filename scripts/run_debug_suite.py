@@ -0,0 +1,67 @@
+"""Run the document debug scripts against a single fetch of the Google Doc."""
+
+import asyncio
+import logging
+
+from app.config import get_settings
+from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs.client import PARSER_AND_TAB_INSPECTION_FIELDS
+from scripts._shared import run_async
+from scripts.debug_tab_parsing import inspect_tab_parsing
+from scripts.debug_tab_structure import inspect_tab_structure
+from scripts.read_document_content import print_document_content
+from scripts.test_tab_properties import inspect_tab_properties
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+async def run_debug_suite():
+    """Fetch the document once and run every document inspection against it."""
+    print("🧰 Running Document Debug Suite")
+    print("=" * 60)
+
+    try:
+        settings = get_settings()
+
+        # Initialize Google Docs components
+        docs_client = GoogleDocsClient(
+            service_account_path=settings.google_service_account_key_path
+        )
+        docs_parser = GoogleDocsParser()
+
+        # One Docs API hit covers both the raw tab inspections and the parser
+        print(f"📥 Fetching document: {settings.google_docs_id}")
+        document = await asyncio.to_thread(
+            docs_client.get_document,
+            settings.google_docs_id,
+            fields=PARSER_AND_TAB_INSPECTION_FIELDS,
+        )
+        parsed_doc = docs_parser.parse_document(document, fields=PARSER_AND_TAB_INSPECTION_FIELDS)
+
+        # The inspections only print, so run them in order to keep their output readable
+        inspections = [
+            ("Tab Structure", lambda: inspect_tab_structure(document)),
+            ("Tab Parsing", lambda: inspect_tab_parsing(parsed_doc)),
+            ("Document Content", lambda: print_document_content(parsed_doc)),
+            ("Tab Properties", lambda: inspect_tab_properties(document)),
+        ]
+        for name, inspect in inspections:
+            print("\n" + "=" * 60)
+            print(f"🔍 {name}")
+            print("=" * 60)
+            inspect()
+
+        print("\n🎉 Debug suite complete!")
+
+    except Exception as e:
+        print(f"❌ Debug suite failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    run_async(run_debug_suite())
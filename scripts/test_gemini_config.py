@@ -4,6 +4,7 @@ import asyncio
 import logging
 from app.config import get_settings
 from app.llm.factory import create_llm_provider
+from scripts._shared import run_async
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,10 +30,13 @@ async def test_gemini_config():
         print(f"   Provider type: {type(llm_provider).__name__}")
         print()
         
-        # Test a simple response
-        print("🤖 Testing response generation...")
-        response = await llm_provider.generate_response(
-            prompt="What is artificial intelligence? Answer in one sentence."
+        # Response and embedding calls are independent, so run them concurrently
+        print("🤖 Testing response and embedding generation...")
+        response, embedding = await asyncio.gather(
+            llm_provider.generate_response(
+                prompt="What is artificial intelligence? Answer in one sentence."
+            ),
+            llm_provider.generate_embedding("test embedding text"),
         )
         
         if response.success:
@@ -43,10 +47,6 @@ async def test_gemini_config():
             print(f"❌ Response failed: {response.error}")
         print()
         
-        # Test embeddings
-        print("🔢 Testing embedding generation...")
-        embedding = await llm_provider.generate_embedding("test embedding text")
-        
         if embedding.success:
             print("✅ Embedding generation successful")
             print(f"   Embedding dimensions: {len(embedding.embedding)}")
@@ -63,4 +63,4 @@ async def test_gemini_config():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_gemini_config())
\ No newline at end of file
+    run_async(test_gemini_config())
\ No newline at end of file
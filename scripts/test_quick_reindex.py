@@ -1,11 +1,10 @@
 """Quick test to reindex a few chunks and verify tab names are working."""
 
-import asyncio
 import logging
 
 from app.config import get_settings
 from app.google_docs import GoogleDocsClient, GoogleDocsParser
-from app.embedding import DocumentIndexer
+from scripts._shared import get_collection, get_indexer, load_or_fetch, run_async
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -27,27 +26,26 @@ async def test_quick_reindex():
             service_account_path=settings.google_service_account_key_path
         )
         docs_parser = GoogleDocsParser()
-        indexer = DocumentIndexer()
+        indexer = get_indexer()
         
         # Fetch and parse document
         print("📥 Fetching document...")
-        document = docs_client.get_document(settings.google_docs_id)
-        parsed_doc = docs_parser.parse_document(document)
+        parsed_doc = load_or_fetch(docs_client, docs_parser, settings.google_docs_id)
         
         print(f"📑 Document: {parsed_doc.title}")
         print(f"📊 Sections: {len(parsed_doc.sections)}")
         
         # Check tab names in parsed sections
         print("\n🔍 Tab names in parsed sections:")
-        tab_names = set()
-        for section in parsed_doc.sections:
-            if section.tab_title:
-                tab_names.add(section.tab_title)
+        # Ordered dedup keeps tabs in document order
+        tab_names = list(
+            dict.fromkeys(section.tab_title for section in parsed_doc.sections if section.tab_title)
+        )
         
-        for tab_name in sorted(tab_names):
+        for tab_name in tab_names:
             print(f"   ✅ Tab: '{tab_name}'")
         
-        if not tab_names or any(name == "Untitled Tab" for name in tab_names):
+        if not tab_names or "Untitled Tab" in tab_names:
             print("   ⚠️  Warning: Some tabs have fallback names")
         
         # Quick reindex with just a few chunks
@@ -66,19 +64,13 @@ async def test_quick_reindex():
         print(f"   Success: {stats['indexing_complete']}")
         
         # Check what got stored in vector DB
-        from app.embedding.vectorizer import ChromaVectorDatabase
-        vector_db = ChromaVectorDatabase()
-        
-        # Get collection stats
-        collection_stats = await vector_db.get_collection_stats("test_tab_names")
+        collection_stats = await indexer.vector_db.get_collection_stats("test_tab_names")
         print(f"   Stored chunks: {collection_stats.get('total_chunks', 0)}")
         
         # Get a sample chunk to check metadata
-        import chromadb
-        chroma_client = chromadb.HttpClient(host="localhost", port=8000)
-        collection = chroma_client.get_collection("test_tab_names")
+        collection = get_collection("test_tab_names")
         
-        result = collection.peek(limit=3)
+        result = collection.get(limit=3, include=["metadatas"])
         
         if result and 'metadatas' in result:
             print(f"\n📋 Sample metadata:")
@@ -96,4 +88,4 @@ async def test_quick_reindex():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_quick_reindex())
\ No newline at end of file
+    run_async(test_quick_reindex())
\ No newline at end of file
@@ -1,11 +1,10 @@
 """Test that tab IDs will be stored correctly after the fix."""
 
-import asyncio
 import logging
 
 from app.config import get_settings
 from app.google_docs import GoogleDocsClient, GoogleDocsParser
-from app.embedding import DocumentIndexer
+from scripts._shared import get_collection, get_indexer, load_or_fetch, run_async
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -27,12 +26,11 @@ async def test_tab_id_fix():
             service_account_path=settings.google_service_account_key_path
         )
         docs_parser = GoogleDocsParser()
-        indexer = DocumentIndexer()
+        indexer = get_indexer()
         
         # Fetch and parse document
         print("📥 Fetching and parsing document...")
-        document = docs_client.get_document(settings.google_docs_id)
-        parsed_doc = docs_parser.parse_document(document)
+        parsed_doc = load_or_fetch(docs_client, docs_parser, settings.google_docs_id)
         
         # Check first few sections have tab IDs
         print(f"\n🔍 Checking parsed sections for tab IDs:")
@@ -54,11 +52,9 @@ async def test_tab_id_fix():
         print(f"✅ Indexed {stats['chunks_created']} chunks")
         
         # Check what got stored
-        import chromadb
-        chroma_client = chromadb.HttpClient(host="localhost", port=8000)
-        collection = chroma_client.get_collection("test_tab_id_fix")
+        collection = get_collection("test_tab_id_fix")
         
-        result = collection.peek(limit=3)
+        result = collection.get(limit=3, include=["metadatas"])
         
         if result and 'metadatas' in result:
             print(f"\n📋 Sample stored metadata:")
@@ -93,4 +89,4 @@ async def test_tab_id_fix():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_tab_id_fix())
\ No newline at end of file
+    run_async(test_tab_id_fix())
\ No newline at end of file
@@ -1,11 +1,13 @@
 """Test script to inspect Google Docs tab properties and validate tab title extraction."""
 
-import asyncio
-import json
 import logging
+import sys
+from typing import Any
 
 from app.config import get_settings
 from app.google_docs import GoogleDocsClient
+from app.google_docs.client import TAB_INSPECTION_FIELDS
+from scripts._shared import dump_json, run_async
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +16,105 @@ logging.getLogger("httpcore").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+def inspect_tab_properties(document: dict[str, Any]) -> None:
+    """Print each tab's properties and which title our extraction logic would choose.
+
+    Args:
+        document: Raw Google Docs document with tab properties and content
+    """
+    print(f"📑 Document title: {document.get('title', 'No title')}")
+    print()
+
+    # Check if document has tabs
+    tabs = document.get("tabs", [])
+    if not tabs:
+        print("❌ Document has no tabs")
+        return
+
+    print(f"📚 Found {len(tabs)} tabs")
+    print("-" * 40)
+
+    # Inspect each tab, writing its report in one go
+    for i, tab in enumerate(tabs):
+        lines = [f"\n🔖 Tab {i+1}:", f"   Raw tab keys: {list(tab.keys())}"]
+
+        # Tab properties
+        tab_properties = tab.get("tabProperties", {})
+        lines.append(f"   Tab properties keys: {list(tab_properties.keys())}")
+        lines.append(f"   Tab properties: {dump_json(tab_properties)}")
+
+        # Test our extraction methods
+        lines.append(f"\n   🧪 Testing extraction methods:")
+
+        # Method 1: Direct title
+        title = tab_properties.get("title")
+        lines.append(f"   - Direct title: {repr(title)}")
+
+        # Method 2: Index-based
+        index = tab_properties.get("index")
+        if index is not None:
+            index_title = f"Tab {index + 1}"
+            lines.append(f"   - Index-based title: {repr(index_title)}")
+        else:
+            lines.append(f"   - Index-based title: None (no index)")
+
+        # Method 3: Tab ID
+        tab_id = tab_properties.get("tabId")
+        lines.append(f"   - Tab ID: {repr(tab_id)}")
+
+        # Method 4: First paragraph (sample)
+        document_tab = tab.get("documentTab", {})
+        content = document_tab.get("body", {}).get("content", [])
+
+        # Single pass: first paragraph text (first 5 items only) and heading count
+        first_text = None
+        sections_count = 0
+        for position, item in enumerate(content):
+            paragraph = item.get("paragraph")
+            if paragraph is None:
+                continue
+
+            if first_text is None and position < 5:
+                for element in paragraph.get("elements", []):
+                    text = element.get("textRun", {}).get("content", "").strip()
+                    if len(text) > 1:  # Skip single chars like newlines
+                        first_text = text
+                        break
+
+            named_style = paragraph.get("paragraphStyle", {}).get("namedStyleType", "")
+            if "HEADING" in named_style:
+                sections_count += 1
+
+        if first_text:
+            trimmed_text = first_text[:50] + "..." if len(first_text) > 50 else first_text
+            lines.append(f"   - First paragraph text: {repr(trimmed_text)}")
+        else:
+            lines.append(f"   - First paragraph text: None")
+
+        # Test what we'd actually use
+        lines.append(f"\n   🎯 What our current logic would choose:")
+        if "title" in tab_properties and tab_properties["title"]:
+            chosen = tab_properties["title"]
+            method = "Direct title"
+        elif "index" in tab_properties:
+            chosen = f"Tab {tab_properties['index'] + 1}"
+            method = "Index-based"
+        elif first_text and len(first_text.strip()) < 100:
+            chosen = first_text.strip()
+            method = "First paragraph"
+        else:
+            chosen = "Untitled Tab"
+            method = "Fallback"
+
+        lines.append(f"   ✅ Chosen: {repr(chosen)} (using {method})")
+
+        lines.append(f"   📊 Found ~{sections_count} headings in this tab")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    print("\n" + "=" * 60)
+    print("🎉 Tab properties inspection complete!")
+
+
 async def test_tab_properties():
     """Test Google Docs tab properties extraction."""
     print("🔍 Testing Google Docs Tab Properties")
@@ -29,104 +130,9 @@ async def test_tab_properties():
         
         # Fetch document
         print(f"📥 Fetching document: {settings.google_docs_id}")
-        document = docs_client.get_document(settings.google_docs_id)
+        document = docs_client.get_document(settings.google_docs_id, fields=TAB_INSPECTION_FIELDS)
         
-        print(f"📑 Document title: {document.get('title', 'No title')}")
-        print()
-        
-        # Check if document has tabs
-        tabs = document.get("tabs", [])
-        if not tabs:
-            print("❌ Document has no tabs")
-            return
-            
-        print(f"📚 Found {len(tabs)} tabs")
-        print("-" * 40)
-        
-        # Inspect each tab
-        for i, tab in enumerate(tabs):
-            print(f"\n🔖 Tab {i+1}:")
-            print(f"   Raw tab keys: {list(tab.keys())}")
-            
-            # Tab properties
-            tab_properties = tab.get("tabProperties", {})
-            print(f"   Tab properties keys: {list(tab_properties.keys())}")
-            print(f"   Tab properties: {json.dumps(tab_properties, indent=4)}")
-            
-            # Test our extraction methods
-            print(f"\n   🧪 Testing extraction methods:")
-            
-            # Method 1: Direct title
-            title = tab_properties.get("title")
-            print(f"   - Direct title: {repr(title)}")
-            
-            # Method 2: Index-based
-            index = tab_properties.get("index")
-            if index is not None:
-                index_title = f"Tab {index + 1}"
-                print(f"   - Index-based title: {repr(index_title)}")
-            else:
-                print(f"   - Index-based title: None (no index)")
-            
-            # Method 3: Tab ID
-            tab_id = tab_properties.get("tabId")
-            print(f"   - Tab ID: {repr(tab_id)}")
-            
-            # Method 4: First paragraph (sample)
-            document_tab = tab.get("documentTab", {})
-            content = document_tab.get("body", {}).get("content", [])
-            
-            first_text = None
-            for item in content[:5]:  # Check first 5 items
-                if "paragraph" in item:
-                    paragraph = item["paragraph"]
-                    elements = paragraph.get("elements", [])
-                    for element in elements:
-                        text_run = element.get("textRun", {})
-                        text = text_run.get("content", "").strip()
-                        if text and len(text) > 1:  # Skip single chars like newlines
-                            first_text = text
-                            break
-                    if first_text:
-                        break
-            
-            if first_text:
-                trimmed_text = first_text[:50] + "..." if len(first_text) > 50 else first_text
-                print(f"   - First paragraph text: {repr(trimmed_text)}")
-            else:
-                print(f"   - First paragraph text: None")
-            
-            # Test what we'd actually use
-            print(f"\n   🎯 What our current logic would choose:")
-            if "title" in tab_properties and tab_properties["title"]:
-                chosen = tab_properties["title"]
-                method = "Direct title"
-            elif "index" in tab_properties:
-                chosen = f"Tab {tab_properties['index'] + 1}"
-                method = "Index-based"
-            elif first_text and len(first_text.strip()) < 100:
-                chosen = first_text.strip()
-                method = "First paragraph"
-            else:
-                chosen = "Untitled Tab"
-                method = "Fallback"
-            
-            print(f"   ✅ Chosen: {repr(chosen)} (using {method})")
-            
-            # Check sections too
-            sections_count = 0
-            for item in content:
-                if "paragraph" in item:
-                    paragraph = item["paragraph"]
-                    style = paragraph.get("paragraphStyle", {})
-                    named_style = style.get("namedStyleType", "")
-                    if "HEADING" in named_style:
-                        sections_count += 1
-            
-            print(f"   📊 Found ~{sections_count} headings in this tab")
-            
-        print("\n" + "=" * 60)
-        print("🎉 Tab properties inspection complete!")
+        inspect_tab_properties(document)
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
@@ -135,4 +141,4 @@ async def test_tab_properties():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_tab_properties())
\ No newline at end of file
+    run_async(test_tab_properties())
\ No newline at end of file
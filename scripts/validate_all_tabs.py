@@ -1,17 +1,37 @@
 """Test script to list all tabs and their headings from the Google Docs document."""
 
 import asyncio
-from pathlib import Path
 
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs import GoogleDocsParser
+from scripts._shared import get_docs_client
+
+# Translation table that flattens newlines in previews
+_NL = str.maketrans({"\n": " "})
+
+# Indent strings for heading levels 1-16, indexed by level - 1
+_INDENTS = ["  " * i for i in range(16)]
+
+
+def _indent(level: int) -> str:
+    """Get the indent for a heading level."""
+    if 0 < level <= len(_INDENTS):
+        return _INDENTS[level - 1]
+    return "  " * (level - 1)
+
+
+def _preview(text: str, length: int = 100) -> str:
+    """Get a single-line preview of text, truncated to length characters."""
+    preview = text[:length].translate(_NL)
+    if len(text) > length:
+        preview += "..."
+    return preview
 
 
 async def test_all_tabs():
     """Test accessing all tabs in the Google Docs document."""
     url = "https://docs.google.com/document/d/1zbZjXJP948_Ud6vNYGZ5-Kae9q456SHgRiSEtEX-J9M/edit?tab=t.pbxyea5hgyv7#heading=h.ua4i2dyops6a"
 
-    credentials_path = Path("credentials/google-docs-service-account.json")
-    client = GoogleDocsClient(service_account_path=credentials_path)
+    client = get_docs_client()
     parser = GoogleDocsParser()
 
     try:
@@ -19,7 +39,7 @@ async def test_all_tabs():
         print(f"📄 Document ID: {document_id}")
 
         # Get document with all tabs
-        document = client.get_document(document_id, include_tabs=True)
+        document = await asyncio.to_thread(client.get_document, document_id, include_tabs=True)
         print(f"📋 Document Title: {document.get('title', 'Unknown')}")
 
         # Parse the document with tab support
@@ -39,43 +59,36 @@ async def test_all_tabs():
 
                 # Show subsections (content within the tab)
                 for j, subsection in enumerate(section.subsections, 1):
-                    indent = "  " * (subsection.level - 1)
+                    indent = _indent(subsection.level)
                     print(
                         f"   {indent}├─ Section {j}: {subsection.title} (Level {subsection.level})"
                     )
 
                     # Show preview of content
                     if subsection.elements:
-                        preview = subsection.elements[0].text[:100].replace("\n", " ")
-                        if len(subsection.elements[0].text) > 100:
-                            preview += "..."
-                        print(f"   {indent}   Preview: {preview}")
+                        print(f"   {indent}   Preview: {_preview(subsection.elements[0].text)}")
 
                     # Show nested subsections
                     for k, nested in enumerate(subsection.subsections, 1):
-                        nested_indent = "  " * (nested.level - 1)
+                        nested_indent = _indent(nested.level)
                         print(
                             f"   {nested_indent}   └─ Nested {k}: {nested.title} (Level {nested.level})"
                         )
 
             else:
                 # This is a regular section (not a tab)
-                indent = "  " * (section.level - 1)
+                indent = _indent(section.level)
                 print(f"\n📄 {indent}Section {i}: {section.title} (Level {section.level})")
                 print(f"   {indent}📊 Contains {len(section.elements)} elements")
 
                 if section.elements:
-                    preview = section.elements[0].text[:100].replace("\n", " ")
-                    if len(section.elements[0].text) > 100:
-                        preview += "..."
-                    print(f"   {indent}Preview: {preview}")
+                    print(f"   {indent}Preview: {_preview(section.elements[0].text)}")
 
         # Show document statistics
         print("\n" + "=" * 80)
         print("📊 DOCUMENT STATISTICS")
         print("=" * 80)
 
-        full_text = parsed_doc.get_full_text()
         total_elements = sum(len(section.elements) for section in parsed_doc.sections)
 
         # Count tabs vs regular sections
@@ -85,8 +98,8 @@ async def test_all_tabs():
         print(f"📑 Total tabs: {tab_count}")
         print(f"📄 Total sections: {section_count}")
         print(f"📝 Total elements: {total_elements}")
-        print(f"📏 Total characters: {len(full_text):,}")
-        print(f"📊 Estimated words: {len(full_text.split()):,}")
+        print(f"📏 Total characters: {parsed_doc.char_count():,}")
+        print(f"📊 Estimated words: {parsed_doc.word_count():,}")
 
         # List all tab titles
         tab_titles = [
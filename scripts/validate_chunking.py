@@ -1,12 +1,23 @@
 """Test script to demonstrate document chunking functionality."""
 
 import asyncio
-from pathlib import Path
+from array import array
+from dataclasses import replace
 
-from app.chunking import ChunkParser
+from app.chunking import Chunk, ChunkParser
 from app.config import get_settings
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
-from app.llm.base import create_llm_provider
+from app.google_docs import GoogleDocsParser, ParsedDocument
+from app.llm.base import LLMProvider
+from scripts._shared import get_docs_client, get_llm_provider
+
+
+async def _smart_chunk(
+    parser: ChunkParser, document: ParsedDocument, llm_provider: LLMProvider
+) -> list[Chunk] | None:
+    """Smart-chunk a document, or return None if the LLM provider is unhealthy."""
+    if not await llm_provider.health_check():
+        return None
+    return await parser.chunk_document(document, llm_provider)
 
 
 async def test_chunking():
@@ -21,14 +32,13 @@ async def test_chunking():
     print()
 
     # Create clients
-    credentials_path = Path("credentials/google-docs-service-account.json")
-    docs_client = GoogleDocsClient(service_account_path=credentials_path)
+    docs_client = get_docs_client()
     docs_parser = GoogleDocsParser()
 
     try:
         # Fetch and parse document
         print("📄 Fetching document...")
-        document = docs_client.get_document(settings.google_docs_id)
+        document = await asyncio.to_thread(docs_client.get_document, settings.google_docs_id)
         parsed_doc = docs_parser.parse_document(document)
 
         print(f"✅ Parsed {len(parsed_doc.sections)} sections")
@@ -62,31 +72,38 @@ async def test_chunking():
             print(f"   Preview: {preview}...")
             print()
 
-        # Test smart chunking with LLM
-        print("🤖 Testing Smart Chunking Strategy")
-        print("-" * 30)
+        # Smart chunking and the embedding test are independent LLM round-trips, so
+        # share one provider and run them concurrently
+        llm_provider = await get_llm_provider()
 
-        try:
-            llm_provider = await create_llm_provider()
+        smart_parser = ChunkParser(use_smart_chunking=True, max_chunk_size=1200, overlap_size=150)
 
-            # Test LLM connection first
-            health_check = await llm_provider.health_check()
-            if not health_check:
-                print("⚠️  LLM provider health check failed, skipping smart chunking")
-                return
+        # Use only first few sections for testing to avoid long LLM calls
+        test_sections = parsed_doc.sections[:3]
+        test_doc = replace(parsed_doc, sections=test_sections)
+        test_texts = [chunk.content for chunk in basic_chunks] or ["Test text"]
 
-            smart_parser = ChunkParser(
-                use_smart_chunking=True, max_chunk_size=1200, overlap_size=150
-            )
+        print(
+            f"🧠 Smart-chunking {len(test_sections)} sections and embedding "
+            f"{len(test_texts)} chunks concurrently..."
+        )
+        print()
+        smart_chunks, embedding_results = await asyncio.gather(
+            _smart_chunk(smart_parser, test_doc, llm_provider),
+            llm_provider.generate_embeddings(test_texts),
+            return_exceptions=True,
+        )
 
-            # Use only first few sections for testing to avoid long LLM calls
-            test_sections = parsed_doc.sections[:3]
-            test_doc = type(parsed_doc)(
-                title=parsed_doc.title, document_id=parsed_doc.document_id, sections=test_sections
-            )
+        # Report smart chunking
+        print("🤖 Testing Smart Chunking Strategy")
+        print("-" * 30)
 
-            print(f"🧠 Processing {len(test_sections)} sections with LLM assistance...")
-            smart_chunks = await smart_parser.chunk_document(test_doc, llm_provider)
+        if isinstance(smart_chunks, Exception):
+            print(f"⚠️  Smart chunking failed: {smart_chunks}")
+            print("   This is expected if LLM is not available")
+        elif smart_chunks is None:
+            print("⚠️  LLM provider health check failed, skipping smart chunking")
+        else:
             smart_stats = smart_parser.get_chunk_statistics(smart_chunks)
 
             print(f"✅ Created {len(smart_chunks)} smart chunks")
@@ -110,29 +127,33 @@ async def test_chunking():
                 print(f"   Preview: {preview}...")
                 print()
 
-        except Exception as e:
-            print(f"⚠️  Smart chunking failed: {e}")
-            print("   This is expected if LLM is not available")
-
-        # Test embedding generation
+        # Report embedding generation over every basic chunk
         print("🔢 Testing Embedding Generation")
         print("-" * 30)
 
-        try:
-            llm_provider = await create_llm_provider()
-            test_text = basic_chunks[0].content if basic_chunks else "Test text"
-
-            embedding_result = await llm_provider.generate_embedding(test_text)
-
-            if embedding_result.success:
-                print(f"✅ Generated embedding with {len(embedding_result.embedding)} dimensions")
-                print(f"   Model: {embedding_result.model}")
-                print(f"   First 5 values: {embedding_result.embedding[:5]}")
+        if isinstance(embedding_results, Exception):
+            print(f"⚠️  Embedding test failed: {embedding_results}")
+        else:
+            failed = [result for result in embedding_results if not result.success]
+
+            if not failed:
+                # Pack the vectors into one flat float32 buffer instead of keeping lists of floats
+                dimensions = len(embedding_results[0].embedding)
+                embeddings = array("f")
+                for result in embedding_results:
+                    embeddings.extend(result.embedding)
+                print(f"✅ Generated {len(embedding_results)} embeddings")
+                print(f"   Dimensions: {dimensions}")
+                print(f"   Model: {embedding_results[0].model}")
+                print(
+                    f"   Matrix size: {len(embeddings) * embeddings.itemsize / 1024:.1f} KiB (float32)"
+                )
+                print(f"   First 5 values: {embeddings[:5].tolist()}")
             else:
-                print(f"❌ Embedding generation failed: {embedding_result.error}")
-
-        except Exception as e:
-            print(f"⚠️  Embedding test failed: {e}")
+                print(
+                    f"❌ Embedding generation failed for {len(failed)}/{len(embedding_results)} "
+                    f"chunks: {failed[0].error}"
+                )
 
         print()
         print("🎉 Chunking test completed!")
@@ -11,6 +11,9 @@ from app.query import QueryProcessor, QueryContext
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on questions in flight at once; lower it if the LLM provider rate-limits
+MAX_CONCURRENT_QUERIES = 6
+
 
 async def test_complete_pipeline():
     """Test the complete RAG pipeline end-to-end."""
@@ -45,8 +48,8 @@ async def test_complete_pipeline():
             "What are the features of fuel delivery management?",
         ]
         
-        for query in test_queries:
-            cleaned = query_processor.preprocess_query(query)
+        cleaned_queries = [query_processor.preprocess_query(query) for query in test_queries]
+        for query, cleaned in zip(test_queries, cleaned_queries, strict=True):
             print(f"   '{query}' → '{cleaned}'")
         print()
         
@@ -61,46 +64,55 @@ async def test_complete_pipeline():
             "Tell me about automated order creation",
         ]
         
-        for question in test_questions:
-            print(f"\n📝 Question: '{question}'")
-            
-            # Create test context
-            context = QueryContext(
-                user_id="test_user",
-                channel_id="test_channel",
-            )
-            
-            try:
-                # Process query
-                result = await query_processor.process_query(
+        # Create test context
+        context = QueryContext(
+            user_id="test_user",
+            channel_id="test_channel",
+        )
+
+        # Questions are independent, so run them concurrently (bounded to respect
+        # provider rate limits) and print the results in order afterwards
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+
+        async def run_query(question: str):
+            async with semaphore:
+                return await query_processor.process_query(
                     query=question,
                     context=context,
                     search_limit=3,
                     min_similarity=0.1,
                 )
-                
-                print(f"   ⏱️  Processing time: {result.processing_time:.2f}s")
-                print(f"   🎯 Confidence: {result.confidence:.0%}")
-                print(f"   📚 Sources used: {result.sources_used}")
-                
-                # Show search results
-                if result.search_results:
-                    print("   🔍 Top sources:")
-                    for i, source in enumerate(result.search_results[:2], 1):
-                        print(f"      {i}. {source.source_tab} → {source.source_section} ({source.similarity:.0%})")
-                
-                # Show answer (truncated)
-                answer_preview = result.answer[:150]
-                if len(result.answer) > 150:
-                    answer_preview += "..."
-                print(f"   💡 Answer: {answer_preview}")
-                
-                # Test Slack formatting
-                slack_response = query_processor.format_for_slack(result)
-                print(f"   📱 Slack format length: {len(slack_response)} chars")
-                
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
+
+        results = await asyncio.gather(
+            *(run_query(question) for question in test_questions), return_exceptions=True
+        )
+
+        for question, result in zip(test_questions, results, strict=True):
+            print(f"\n📝 Question: '{question}'")
+
+            if isinstance(result, Exception):
+                print(f"   ❌ Failed: {result}")
+                continue
+
+            print(f"   ⏱️  Processing time: {result.processing_time:.2f}s")
+            print(f"   🎯 Confidence: {result.confidence:.0%}")
+            print(f"   📚 Sources used: {result.sources_used}")
+
+            # Show search results
+            if result.search_results:
+                print("   🔍 Top sources:")
+                for i, source in enumerate(result.search_results[:2], 1):
+                    print(f"      {i}. {source.source_tab} → {source.source_section} ({source.similarity:.0%})")
+
+            # Show answer (truncated)
+            answer_preview = result.answer[:150]
+            if len(result.answer) > 150:
+                answer_preview += "..."
+            print(f"   💡 Answer: {answer_preview}")
+
+            # Test Slack formatting
+            slack_response = query_processor.format_for_slack(result)
+            print(f"   📱 Slack format length: {len(slack_response)} chars")
         
         print("\n" + "=" * 50)
         print("🎉 Complete pipeline validation finished!")
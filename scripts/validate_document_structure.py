@@ -1,25 +1,51 @@
 """Debug script to examine the full document structure and find tabs."""
 
+import argparse
 import asyncio
-import json
 from pathlib import Path
+from typing import Any
 
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs import GoogleDocsParser
+from scripts._shared import cached_get_document, get_docs_client, write_json
 
 
-async def debug_document_structure():
-    """Debug the full document structure to understand tabs."""
+def has_tab_reference(obj: Any) -> bool:
+    """Check whether any key or string value in a JSON structure mentions "tab".
+
+    Walks the structure directly and stops at the first hit, instead of serializing the
+    whole document just to search it.
+
+    Args:
+        obj: Parsed JSON value
+
+    Returns:
+        True if "tab" appears (case-insensitively) in any key or string
+    """
+    if isinstance(obj, dict):
+        return any("tab" in key.lower() or has_tab_reference(value) for key, value in obj.items())
+    if isinstance(obj, list):
+        return any(has_tab_reference(item) for item in obj)
+    if isinstance(obj, str):
+        return "tab" in obj.lower()
+    return False
+
+
+async def debug_document_structure(dump: bool = False):
+    """Debug the full document structure to understand tabs.
+
+    Args:
+        dump: Also save the raw document to debug_document.json
+    """
     url = "https://docs.google.com/document/d/1zbZjXJP948_Ud6vNYGZ5-Kae9q456SHgRiSEtEX-J9M/edit?tab=t.pbxyea5hgyv7#heading=h.ua4i2dyops6a"
 
-    credentials_path = Path("credentials/google-docs-service-account.json")
-    client = GoogleDocsClient(service_account_path=credentials_path)
+    client = get_docs_client()
 
     try:
         document_id = client.extract_document_id_from_url(url)
         print(f"📄 Document ID: {document_id}")
 
         # Get the full document
-        document = client.get_document(document_id)
+        document = await asyncio.to_thread(cached_get_document, client, document_id)
 
         # Print high-level structure
         print(f"📋 Document Title: {document.get('title', 'Unknown')}")
@@ -29,8 +55,7 @@ async def debug_document_structure():
         print("\n🔍 Analyzing document structure...")
 
         # Check if there are tabs mentioned anywhere
-        doc_str = json.dumps(document, indent=2)
-        if "tab" in doc_str.lower():
+        if has_tab_reference(document):
             print("✅ Found 'tab' references in document")
         else:
             print("❌ No 'tab' references found")
@@ -39,8 +64,12 @@ async def debug_document_structure():
         content = document.get("body", {}).get("content", [])
         print(f"\n📊 Body content has {len(content)} items")
 
+        # One pass collects both the section breaks and the items previewed below
         section_breaks = []
+        preview_items = []
         for i, item in enumerate(content):
+            if i < 5:
+                preview_items.append(item)
             if "sectionBreak" in item:
                 section_breaks.append(i)
                 section_break = item["sectionBreak"]
@@ -77,7 +106,7 @@ async def debug_document_structure():
 
         # Print first few content items to see structure
         print(f"\n📝 First 5 content items:")
-        for i, item in enumerate(content[:5]):
+        for i, item in enumerate(preview_items):
             print(f"Item {i}: {list(item.keys())}")
             if "paragraph" in item:
                 para = item["paragraph"]
@@ -89,11 +118,10 @@ async def debug_document_structure():
         # Let's also check the full text length
         parser = GoogleDocsParser()
         parsed_doc = parser.parse_document(document)
-        full_text = parsed_doc.get_full_text()
 
         print(f"\n📏 Parsed document stats:")
-        print(f"   Total characters: {len(full_text)}")
-        print(f"   Total words: {len(full_text.split())}")
+        print(f"   Total characters: {parsed_doc.char_count()}")
+        print(f"   Total words: {parsed_doc.word_count()}")
         print(f"   Total sections: {len(parsed_doc.sections)}")
 
         # Print the section titles we found
@@ -103,9 +131,9 @@ async def debug_document_structure():
                 print(f"   {i + 1}. {section.title}")
 
         # Save the raw document to file for inspection
-        with open("debug_document.json", "w") as f:
-            json.dump(document, f, indent=2)
-        print(f"\n💾 Full document saved to debug_document.json")
+        if dump:
+            write_json(Path("debug_document.json"), document)
+            print(f"\n💾 Full document saved to debug_document.json")
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -115,4 +143,11 @@ async def debug_document_structure():
 
 
 if __name__ == "__main__":
-    asyncio.run(debug_document_structure())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--dump",
+        action="store_true",
+        help="Save the raw document JSON to debug_document.json",
+    )
+    args = parser.parse_args()
+    asyncio.run(debug_document_structure(dump=args.dump))
@@ -1,9 +1,9 @@
 """Test script for Google Docs integration."""
 
 import asyncio
-from pathlib import Path
 
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs import GoogleDocsParser
+from scripts._shared import cached_get_document, get_docs_client
 
 
 async def test_google_docs_integration():
@@ -12,8 +12,7 @@ async def test_google_docs_integration():
     url = "https://docs.google.com/document/d/1zbZjXJP948_Ud6vNYGZ5-Kae9q456SHgRiSEtEX-J9M/edit?tab=t.pbxyea5hgyv7#heading=h.ua4i2dyops6a"
 
     # Create client with explicit path to avoid settings validation
-    credentials_path = Path("credentials/google-docs-service-account.json")
-    client = GoogleDocsClient(service_account_path=credentials_path)
+    client = get_docs_client()
     parser = GoogleDocsParser()
 
     try:
@@ -32,7 +31,7 @@ async def test_google_docs_integration():
 
         # Get document
         print("Fetching document...")
-        document = client.get_document(document_id)
+        document = await asyncio.to_thread(cached_get_document, client, document_id)
         print(f"Document title: {document.get('title', 'Unknown')}")
 
         # First, let's examine the raw document structure
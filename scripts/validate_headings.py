@@ -1,9 +1,11 @@
 """Script to list all headings from the Google Docs document."""
 
 import asyncio
-from pathlib import Path
+import sys
 
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs import GoogleDocsParser
+from app.google_docs.client import PARSER_FIELDS
+from scripts._shared import cached_get_document, get_docs_client
 
 
 async def list_document_headings():
@@ -12,8 +14,7 @@ async def list_document_headings():
     url = "https://docs.google.com/document/d/1zbZjXJP948_Ud6vNYGZ5-Kae9q456SHgRiSEtEX-J9M/edit?tab=t.pbxyea5hgyv7#heading=h.ua4i2dyops6a"
 
     # Create client and parser
-    credentials_path = Path("credentials/google-docs-service-account.json")
-    client = GoogleDocsClient(service_account_path=credentials_path)
+    client = get_docs_client()
     parser = GoogleDocsParser()
 
     try:
@@ -21,25 +22,30 @@ async def list_document_headings():
         document_id = client.extract_document_id_from_url(url)
         print(f"📄 Document ID: {document_id}")
 
-        document = client.get_document(document_id)
+        # Only fetch what the parser reads
+        document = await asyncio.to_thread(
+            cached_get_document, client, document_id, fields=PARSER_FIELDS
+        )
         print(f"📋 Document Title: {document.get('title', 'Unknown')}")
 
         # Parse document
-        parsed_doc = parser.parse_document(document)
+        parsed_doc = parser.parse_document(document, fields=PARSER_FIELDS)
 
         print(f"\n🔍 Found {len(parsed_doc.sections)} sections with headings:")
         print("=" * 60)
 
-        # List all headings
+        # List all headings, writing each section's block in one go
         for i, section in enumerate(parsed_doc.sections, 1):
             # Show section heading
             if section.title:
                 indent = "  " * (section.level - 1) if section.level > 0 else ""
                 level_marker = "📌" if section.level == 3 else "📍"
-                print(f"{level_marker} {indent}Section {i}: {section.title}")
-                print(f"   {indent}├─ Level: {section.level}")
-                print(f"   {indent}├─ Elements: {len(section.elements)}")
-                print(f"   {indent}└─ Subsections: {len(section.subsections)}")
+                lines = [
+                    f"{level_marker} {indent}Section {i}: {section.title}",
+                    f"   {indent}├─ Level: {section.level}",
+                    f"   {indent}├─ Elements: {len(section.elements)}",
+                    f"   {indent}└─ Subsections: {len(section.subsections)}",
+                ]
 
                 # Show first bit of content
                 if section.elements:
@@ -49,17 +55,18 @@ async def list_document_headings():
                         if len(first_element.text) > 100
                         else first_element.text
                     )
-                    print(f"   {indent}   Preview: {preview}")
+                    lines.append(f"   {indent}   Preview: {preview}")
 
-                print()
+                lines.append("")
 
-                # Show subsections recursively
-                if section.subsections:
-                    for j, subsection in enumerate(section.subsections, 1):
-                        sub_indent = "  " * (subsection.level - 1)
-                        print(f"   {sub_indent}└─ Subsection {j}: {subsection.title}")
-                        print(f"      {sub_indent}   Level: {subsection.level}")
-                        print()
+                # Show subsections
+                for j, subsection in enumerate(section.subsections, 1):
+                    sub_indent = "  " * (subsection.level - 1)
+                    lines.append(f"   {sub_indent}└─ Subsection {j}: {subsection.title}")
+                    lines.append(f"      {sub_indent}   Level: {subsection.level}")
+                    lines.append("")
+
+                sys.stdout.write("\n".join(lines) + "\n")
 
         # Show document stats
         print("=" * 60)
@@ -69,9 +76,8 @@ async def list_document_headings():
         total_elements = sum(len(section.elements) for section in parsed_doc.sections)
         print(f"   • Total elements: {total_elements}")
 
-        full_text = parsed_doc.get_full_text()
-        print(f"   • Total characters: {len(full_text)}")
-        print(f"   • Estimated words: {len(full_text.split())}")
+        print(f"   • Total characters: {parsed_doc.char_count()}")
+        print(f"   • Estimated words: {parsed_doc.word_count()}")
 
         # Show heading hierarchy
         print(f"\n🏗️  Heading Hierarchy:")
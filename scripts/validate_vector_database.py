@@ -1,11 +1,38 @@
 """Validation script for vector database integration and document indexing."""
 
 import asyncio
-from pathlib import Path
+import logging
+import sys
+from dataclasses import replace
 
 from app.config import get_settings
-from app.embedding import DocumentIndexer
-from app.google_docs import GoogleDocsClient, GoogleDocsParser
+from app.google_docs import GoogleDocsParser
+from scripts._shared import (
+    HNSW_METADATA,
+    embed_queries,
+    get_docs_client,
+    get_indexer,
+    load_or_fetch,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Queries used to check search quality against the indexed sample
+TEST_QUERIES: tuple[str, ...] = (
+    "What is supply and dispatch?",
+    "How does pricing work?",
+    "Features of the system",
+    "Fuel delivery management",
+)
+
+# Per-result report lines; newlines in previews are flattened with _NL
+RESULT_TEMPLATE = (
+    "     {i}. Similarity: {similarity:.3f} | Section: {section}\n"
+    "        Preview: {preview}..."
+)
+_NL = str.maketrans({"\n": " "})
 
 
 async def test_vector_database():
@@ -23,7 +50,7 @@ async def test_vector_database():
     try:
         # Initialize indexer
         print("🚀 Initializing document indexer...")
-        indexer = DocumentIndexer()
+        indexer = get_indexer()
 
         # Health check
         print("🔍 Performing health checks...")
@@ -39,23 +66,22 @@ async def test_vector_database():
 
         # Fetch and parse document (use subset for testing)
         print("📄 Fetching and parsing document...")
-        credentials_path = Path("credentials/google-docs-service-account.json")
-        docs_client = GoogleDocsClient(service_account_path=credentials_path)
+        docs_client = get_docs_client()
         docs_parser = GoogleDocsParser()
 
-        document = docs_client.get_document(settings.google_docs_id)
-        parsed_doc = docs_parser.parse_document(document)
+        # Parsed document is cached on disk between runs
+        parsed_doc = await asyncio.to_thread(
+            load_or_fetch, docs_client, docs_parser, settings.google_docs_id
+        )
 
         # Use only first few sections for testing
         test_sections = parsed_doc.sections[:5]  # Limit to first 5 sections
-        test_doc = type(parsed_doc)(
-            title=f"{parsed_doc.title} (Test Sample)",
-            document_id=parsed_doc.document_id,
-            sections=test_sections,
+        test_doc = replace(
+            parsed_doc, title=f"{parsed_doc.title} (Test Sample)", sections=test_sections
         )
 
         print(f"✅ Using {len(test_sections)} sections for testing")
-        print(f"   Total characters: {len(test_doc.get_full_text())}")
+        print(f"   Total characters: {test_doc.char_count()}")
         print()
 
         # Index document
@@ -67,72 +93,84 @@ async def test_vector_database():
             collection_name=collection_name,
             use_smart_chunking=True,
             generate_embeddings=True,
-            batch_size=5,  # Small batch for testing
+            batch_size=100,  # One embedding call per 100 chunks
+            collection_metadata=HNSW_METADATA,
         )
 
-        print("✅ Document indexing completed!")
-        print(f"   Collection: {indexing_stats['collection_name']}")
-        print(f"   Chunks created: {indexing_stats['chunks_created']}")
-        print(f"   Chunks with embeddings: {indexing_stats['chunks_with_embeddings']}")
-        print(f"   Chunks stored: {indexing_stats['chunks_stored']}")
-        print()
-
-        # Show chunk statistics
+        # Write each report block in one go rather than line by line
         chunk_stats = indexing_stats["chunk_statistics"]
-        print("📊 Chunk Statistics:")
-        print(f"   Average size: {chunk_stats['average_chunk_size']} chars")
-        print(
-            f"   Size range: {chunk_stats['min_chunk_size']}-{chunk_stats['max_chunk_size']} chars"
-        )
-        print(f"   Chunks with questions: {chunk_stats['chunks_with_questions']}")
-        print(f"   Chunks with summaries: {chunk_stats['chunks_with_summaries']}")
-        print(f"   Unique sections: {chunk_stats['unique_sections']}")
-        print()
+        lines = [
+            "✅ Document indexing completed!",
+            f"   Collection: {indexing_stats['collection_name']}",
+            f"   Chunks created: {indexing_stats['chunks_created']}",
+            f"   Chunks with embeddings: {indexing_stats['chunks_with_embeddings']}",
+            f"   Chunks stored: {indexing_stats['chunks_stored']}",
+            "",
+            "📊 Chunk Statistics:",
+            f"   Average size: {chunk_stats['average_chunk_size']} chars",
+            f"   Size range: {chunk_stats['min_chunk_size']}-{chunk_stats['max_chunk_size']} chars",
+            f"   Chunks with questions: {chunk_stats['chunks_with_questions']}",
+            f"   Chunks with summaries: {chunk_stats['chunks_with_summaries']}",
+            f"   Unique sections: {chunk_stats['unique_sections']}",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Test search functionality
         print("🔍 Testing search functionality...")
-        test_queries = [
-            "What is supply and dispatch?",
-            "How does pricing work?",
-            "Features of the system",
-            "Fuel delivery management",
-        ]
-
-        for query in test_queries:
-            print(f"   Query: '{query}'")
-            try:
-                results = await indexer.search_documents(
-                    query=query, collection_name=collection_name, limit=3
+        # Embed every uncached query in one provider call up front
+        query_embeddings = await embed_queries(indexer.llm_provider, list(TEST_QUERIES))
+
+        # Queries are independent, so run them concurrently and print in order
+        responses = await asyncio.gather(
+            *(
+                indexer.search_documents(
+                    query=query,
+                    collection_name=collection_name,
+                    limit=3,
+                    query_embedding=query_embedding,
                 )
+                for query, query_embedding in zip(TEST_QUERIES, query_embeddings, strict=True)
+            ),
+            return_exceptions=True,
+        )
 
-                print(f"   Found {len(results)} results:")
+        for query, results in zip(TEST_QUERIES, responses, strict=True):
+            lines = [f"   Query: '{query}'"]
+            if isinstance(results, Exception):
+                lines.append(f"   ❌ Search failed: {results}")
+            else:
+                lines.append(f"   Found {len(results)} results:")
                 for i, result in enumerate(results, 1):
-                    similarity = result["similarity"]
-                    section = result["metadata"].get("source_section", "Unknown")
-                    preview = result["content"][:100].replace("\n", " ")
-                    print(f"     {i}. Similarity: {similarity:.3f} | Section: {section}")
-                    print(f"        Preview: {preview}...")
-
-                    if result["metadata"].get("summary"):
-                        print(f"        Summary: {result['metadata']['summary']}")
-                print()
-
-            except Exception as e:
-                print(f"   ❌ Search failed: {e}")
-                print()
+                    metadata = result["metadata"]
+                    lines.append(
+                        RESULT_TEMPLATE.format(
+                            i=i,
+                            similarity=result["similarity"],
+                            section=metadata.get("source_section", "Unknown"),
+                            preview=result["content"][:100].translate(_NL),
+                        )
+                    )
+                    if summary := metadata.get("summary"):
+                        lines.append(f"        Summary: {summary}")
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Get final collection statistics
         print("📈 Final Collection Statistics:")
         final_stats = await indexer.get_indexing_stats(collection_name)
 
-        print(f"   Collection: {final_stats['name']}")
-        print(f"   Total chunks: {final_stats['total_chunks']}")
-        print(f"   Chunks with questions: {final_stats.get('chunks_with_questions', 'N/A')}")
-        print(f"   Unique tabs: {final_stats.get('unique_tabs', 'N/A')}")
-        print(f"   Unique sections: {final_stats.get('unique_sections', 'N/A')}")
-        print(f"   Average content length: {final_stats.get('average_content_length', 'N/A')}")
-        print(f"   Average tokens: {final_stats.get('average_tokens', 'N/A')}")
-        print()
+        lines = [
+            f"   Collection: {final_stats['name']}",
+            f"   Total chunks: {final_stats['total_chunks']}",
+            f"   Chunks with questions: {final_stats.get('chunks_with_questions', 'N/A')}",
+            f"   Unique tabs: {final_stats.get('unique_tabs', 'N/A')}",
+            f"   Unique sections: {final_stats.get('unique_sections', 'N/A')}",
+            f"   Average content length: {final_stats.get('average_content_length', 'N/A')}",
+            f"   Average tokens: {final_stats.get('average_tokens', 'N/A')}",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
         print("🎉 Vector database integration test completed successfully!")
         print()
@@ -142,11 +180,8 @@ async def test_vector_database():
         print("   3. Index the full document for production use")
         print(f"   4. Collection '{collection_name}' is ready for querying")
 
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Test failed")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,28 @@
 """Fast validation script for vector database integration using minimal test data."""
 
 import asyncio
+import logging
+import sys
+from typing import Any
 
 from app.chunking.models import Chunk, ChunkMetadata
 from app.config import get_settings
-from app.embedding import DocumentIndexer
+from scripts._shared import HNSW_METADATA, embed_queries, get_indexer
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Test queries with their metadata filters; tab-specific queries filter on
+# source_tab so Chroma searches fewer vectors
+TEST_QUERIES: tuple[tuple[str, dict[str, Any] | None], ...] = (
+    ("What is supply and dispatch?", {"source_tab": "Overview"}),
+    ("How does pricing work?", {"source_tab": "Pricing"}),
+    ("AI features", None),
+)
+
+# Per-result report line
+RESULT_TEMPLATE = "     {i}. Similarity: {similarity:.3f} | Section: {section}"
 
 
 async def test_vector_database_fast():
@@ -20,7 +38,7 @@ async def test_vector_database_fast():
     try:
         # Initialize indexer
         print("🚀 Initializing document indexer...")
-        indexer = DocumentIndexer()
+        indexer = get_indexer()
 
         # Health check
         print("🔍 Performing health checks...")
@@ -80,7 +98,9 @@ async def test_vector_database_fast():
 
         # Generate embeddings (fast batch)
         print("🔢 Generating embeddings...")
-        chunks_with_embeddings = await indexer._generate_embeddings_batch(test_chunks, batch_size=3)
+        chunks_with_embeddings = await indexer._generate_embeddings_batch(
+            test_chunks, batch_size=len(test_chunks)
+        )
 
         successful_embeddings = len([c for c in chunks_with_embeddings if c.embedding])
         print(f"✅ Generated {successful_embeddings}/{len(test_chunks)} embeddings")
@@ -93,7 +113,12 @@ async def test_vector_database_fast():
         # Create collection
         await indexer.vector_db.create_collection(
             collection_name,
-            {"test": True, "fast_validation": True, "chunk_count": len(chunks_with_embeddings)},
+            {
+                "test": True,
+                "fast_validation": True,
+                "chunk_count": len(chunks_with_embeddings),
+                **HNSW_METADATA,
+            },
         )
 
         # Add chunks
@@ -103,27 +128,49 @@ async def test_vector_database_fast():
 
         # Test search functionality
         print("🔍 Testing search functionality...")
-        test_queries = ["What is supply and dispatch?", "How does pricing work?", "AI features"]
+        # Embed every uncached query in one provider call up front
+        query_embeddings = await embed_queries(
+            indexer.llm_provider, [query for query, _ in TEST_QUERIES]
+        )
 
-        for query in test_queries:
-            print(f"   Query: '{query}'")
-            try:
-                results = await indexer.search_documents(
-                    query=query, collection_name=collection_name, limit=2
+        # Searches differ in their filters, so run them concurrently and print in order
+        responses = await asyncio.gather(
+            *(
+                indexer.search_documents(
+                    query=query,
+                    collection_name=collection_name,
+                    limit=2,
+                    metadata_filter=metadata_filter,
+                    query_embedding=query_embedding,
                 )
+                for (query, metadata_filter), query_embedding in zip(
+                    TEST_QUERIES, query_embeddings, strict=True
+                )
+            ),
+            return_exceptions=True,
+        )
 
-                print(f"   Found {len(results)} results:")
+        for (query, metadata_filter), results in zip(TEST_QUERIES, responses, strict=True):
+            lines = [f"   Query: '{query}'"]
+            if metadata_filter:
+                lines.append(f"   Filter: {metadata_filter}")
+            if isinstance(results, Exception):
+                lines.append(f"   ❌ Search failed: {results}")
+            else:
+                lines.append(f"   Found {len(results)} results:")
                 for i, result in enumerate(results, 1):
-                    similarity = result["similarity"]
-                    section = result["metadata"].get("source_section", "Unknown")
-                    print(f"     {i}. Similarity: {similarity:.3f} | Section: {section}")
-                    if result["metadata"].get("summary"):
-                        print(f"        Summary: {result['metadata']['summary']}")
-                print()
-
-            except Exception as e:
-                print(f"   ❌ Search failed: {e}")
-                print()
+                    metadata = result["metadata"]
+                    lines.append(
+                        RESULT_TEMPLATE.format(
+                            i=i,
+                            similarity=result["similarity"],
+                            section=metadata.get("source_section", "Unknown"),
+                        )
+                    )
+                    if summary := metadata.get("summary"):
+                        lines.append(f"        Summary: {summary}")
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Get collection statistics
         print("📈 Collection Statistics:")
@@ -144,11 +191,8 @@ async def test_vector_database_fast():
         print("   3. Search functionality is operational")
         print("   4. Ready for full document indexing")
 
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Test failed")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 
 import asyncio
 import logging
+import sys
 from app.llm.factory import create_llm_provider
 from app.config import get_settings
 
@@ -30,16 +31,7 @@ async def test_llama_integration():
         logger.error("Ollama is not running. Please start it with: brew services start ollama")
         return
     
-    # Test basic response generation
-    logger.info("\n2. Testing basic response generation...")
     prompt = "What is the capital of France?"
-    result = await llm.generate_response(prompt)
-    logger.info(f"   Question: {prompt}")
-    logger.info(f"   Response: {result.content[:100]}...")
-    logger.info(f"   Model: {result.model}")
-    
-    # Test RAG-style response with context
-    logger.info("\n3. Testing RAG response with context...")
     context = """
     The company's new product launch is scheduled for Q2 2024.
     Key features include:
@@ -49,20 +41,7 @@ async def test_llama_integration():
     The pricing starts at $99/month for the basic plan.
     """
     question = "When is the product launch and what's the pricing?"
-    result = await llm.generate_response(question, context)
-    logger.info(f"   Question: {question}")
-    logger.info(f"   Response: {result.content[:200]}...")
-    
-    # Test embedding generation
-    logger.info("\n4. Testing embedding generation...")
     text = "This is a test document for embedding generation."
-    embedding_result = await llm.generate_embedding(text)
-    logger.info(f"   Text: {text}")
-    logger.info(f"   Embedding dimensions: {len(embedding_result.embedding)}")
-    logger.info(f"   Model: {embedding_result.model}")
-    
-    # Test summarization
-    logger.info("\n5. Testing summarization...")
     long_text = """
     Artificial intelligence has made remarkable progress in recent years, 
     particularly in natural language processing. Large language models like 
@@ -72,7 +51,54 @@ async def test_llama_integration():
     development of open-source models has democratized access to AI technology, 
     allowing developers and researchers worldwide to build innovative solutions.
     """
-    summary_result = await llm.summarize(long_text, max_length=50)
+
+    async def stream_response() -> list[str]:
+        """Stream the basic response to stdout, returning the tokens received."""
+        tokens = []
+        async for token in llm.generate_response_stream(prompt):
+            tokens.append(token)
+            sys.stdout.write(token)
+            sys.stdout.flush()
+        return tokens
+
+    # The remaining checks are independent, so run them concurrently
+    logger.info("\n2-5. Running response, RAG, embedding and summarization tests together...")
+    print("   Streaming response: ", end="")
+    tasks = [
+        asyncio.create_task(stream_response()),
+        asyncio.create_task(llm.generate_response(question, context)),
+        asyncio.create_task(llm.generate_embedding(text)),
+        asyncio.create_task(llm.summarize(long_text, max_length=50)),
+    ]
+    try:
+        tokens, rag_result, embedding_result, summary_result = await asyncio.gather(*tasks)
+    finally:
+        # Don't leave the other calls running (or their errors unretrieved) if one failed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    print()
+
+    # Test basic response generation, streamed token by token
+    logger.info("\n2. Testing streamed response generation...")
+    logger.info(f"   Question: {prompt}")
+    logger.info(f"   Streaming: {'✅ Passed' if ''.join(tokens).strip() else '❌ Empty response'}")
+    logger.info(f"   Streamed tokens: {len(tokens)}")
+    logger.info(f"   Model: {settings.ollama_model}")
+
+    # Test RAG-style response with context
+    logger.info("\n3. Testing RAG response with context...")
+    logger.info(f"   Question: {question}")
+    logger.info(f"   Response: {rag_result.content[:200]}...")
+
+    # Test embedding generation
+    logger.info("\n4. Testing embedding generation...")
+    logger.info(f"   Text: {text}")
+    logger.info(f"   Embedding dimensions: {len(embedding_result.embedding)}")
+    logger.info(f"   Model: {embedding_result.model}")
+
+    # Test summarization
+    logger.info("\n5. Testing summarization...")
     logger.info(f"   Original text length: {len(long_text.split())} words")
     logger.info(f"   Summary: {summary_result.content}")
     
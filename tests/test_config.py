@@ -5,14 +5,20 @@ import pytest
 from app.config import Environment, LLMProvider, Settings
 
 
-def test_default_settings():
-    """Test that default settings are loaded correctly."""
-    settings = Settings(
+@pytest.fixture(scope="module")
+def base_settings():
+    """Create validated settings once; tests derive variants with model_copy."""
+    return Settings(
         slack_bot_token="test-bot-token",
         slack_app_token="test-app-token",
         google_docs_id="test-doc-id",
     )
 
+
+def test_default_settings(base_settings):
+    """Test that default settings are loaded correctly."""
+    settings = base_settings
+
     assert settings.llm_provider == LLMProvider.OLLAMA
     assert settings.environment == Environment.DEVELOPMENT
     assert settings.log_level == "INFO"
@@ -20,40 +26,25 @@ def test_default_settings():
     assert settings.chroma_port == 8000
 
 
-def test_chroma_url():
+def test_chroma_url(base_settings):
     """Test ChromaDB URL construction."""
-    settings = Settings(
-        slack_bot_token="test-bot-token",
-        slack_app_token="test-app-token",
-        google_docs_id="test-doc-id",
-        chroma_host="chromadb",
-        chroma_port=8080,
-    )
+    settings = base_settings.model_copy(update={"chroma_host": "chromadb", "chroma_port": 8080})
 
     assert settings.chroma_url == "http://chromadb:8080"
 
 
-def test_validate_openai_config():
+def test_validate_openai_config(base_settings):
     """Test OpenAI configuration validation."""
-    settings = Settings(
-        slack_bot_token="test-bot-token",
-        slack_app_token="test-app-token",
-        google_docs_id="test-doc-id",
-        llm_provider=LLMProvider.OPENAI,
-    )
+    settings = base_settings.model_copy(update={"llm_provider": LLMProvider.OPENAI})
 
     with pytest.raises(ValueError, match="OpenAI API key is required"):
         settings.validate_provider_config()
 
 
-def test_valid_openai_config():
+def test_valid_openai_config(base_settings):
     """Test valid OpenAI configuration."""
-    settings = Settings(
-        slack_bot_token="test-bot-token",
-        slack_app_token="test-app-token",
-        google_docs_id="test-doc-id",
-        llm_provider=LLMProvider.OPENAI,
-        openai_api_key="sk-test-key",
+    settings = base_settings.model_copy(
+        update={"llm_provider": LLMProvider.OPENAI, "openai_api_key": "sk-test-key"}
     )
 
     # Should not raise
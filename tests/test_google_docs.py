@@ -5,7 +5,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.google_docs import DocumentElement, DocumentSection, GoogleDocsClient, GoogleDocsParser
+from app.google_docs import (
+    DocumentElement,
+    DocumentSection,
+    GoogleDocsClient,
+    GoogleDocsParser,
+    ParsedDocument,
+)
+from app.google_docs.client import PARSER_AND_TAB_INSPECTION_FIELDS, PARSER_FIELDS
 
 
 class TestGoogleDocsClient:
@@ -58,6 +65,28 @@ class TestGoogleDocsClient:
         with patch.object(client, "_get_credentials", side_effect=Exception("Auth failed")):
             assert client.health_check() is False
 
+    def test_get_document_with_fields(self):
+        """Test that a field mask is passed through to the Docs API."""
+        client = GoogleDocsClient(service_account_path=Path("/fake/path"))
+        mock_service = MagicMock()
+        mock_service.documents.return_value.get.return_value.execute.return_value = {
+            "title": "Test Document"
+        }
+
+        with patch.object(client, "_get_service", return_value=mock_service):
+            document = client.get_document("test-doc-id", fields="title")
+
+        assert document["title"] == "Test Document"
+        mock_service.documents.return_value.get.assert_called_with(
+            documentId="test-doc-id", fields="title", includeTabsContent=True
+        )
+
+    @pytest.mark.parametrize("fields", [PARSER_FIELDS, PARSER_AND_TAB_INSPECTION_FIELDS])
+    def test_field_masks_cover_nested_tabs(self, fields):
+        """Test that parser field masks request grandchild tab content."""
+        assert "childTabs(tabProperties(tabId,title,index),documentTab(body(" in fields
+        assert fields.count("childTabs(") == 2
+
 
 class TestGoogleDocsParser:
     """Test Google Docs parser."""
@@ -118,6 +147,55 @@ class TestGoogleDocsParser:
         assert len(section.elements) == 1
         assert section.elements[0].text == "This is a test document for parsing."
 
+    def test_parse_document_cached_by_revision(self):
+        """Test that an unchanged revision is parsed only once."""
+        parser = GoogleDocsParser()
+
+        document_data = {
+            "title": "Test Document",
+            "documentId": "test-doc-id",
+            "revisionId": "rev-1",
+            "body": {"content": []},
+        }
+
+        parsed_doc = parser.parse_document(document_data)
+        assert parser.parse_document(dict(document_data)) is parsed_doc
+
+        # A new revision is parsed again
+        changed = {**document_data, "revisionId": "rev-2", "title": "Changed"}
+        assert parser.parse_document(changed).title == "Changed"
+
+        # Documents without a revision ID are never cached
+        unversioned = {"title": "No Revision", "documentId": "test-doc-id", "body": {}}
+        assert parser.parse_document(unversioned) is not parser.parse_document(unversioned)
+
+    def test_parse_document_cache_keyed_on_field_mask(self):
+        """Test that a partial fetch of a revision doesn't stand in for the full document."""
+        parser = GoogleDocsParser()
+
+        partial = {"title": "Test Document", "documentId": "test-doc-id", "revisionId": "rev-1"}
+        full = {
+            **partial,
+            "body": {
+                "content": [
+                    {
+                        "paragraph": {
+                            "elements": [{"textRun": {"content": "Overview\n"}}],
+                            "paragraphStyle": {"namedStyleType": "HEADING_1"},
+                        }
+                    }
+                ]
+            },
+        }
+
+        partial_doc = parser.parse_document(partial, fields="documentId,revisionId,title")
+        full_doc = parser.parse_document(full, fields=PARSER_FIELDS)
+
+        assert full_doc is not partial_doc
+        assert [section.title for section in full_doc.sections] == ["Overview"]
+        assert parser.parse_document(full, fields=PARSER_FIELDS) is full_doc
+        assert parser.parse_document(full, fields=PARSER_FIELDS, include_tabs=False) is not full_doc
+
     def test_parse_heading_styles(self):
         """Test parsing different heading styles."""
         parser = GoogleDocsParser()
@@ -231,3 +309,47 @@ class TestDocumentModels:
         full_text = section.get_full_text()
         expected = "Main Section\n\nMain content\n\nSubsection\n\nSubsection content"
         assert full_text == expected
+
+    def test_char_count_matches_full_text(self):
+        """Test that character counts match the length of the full text."""
+        subsection = DocumentSection(
+            title="Sub section",
+            level=2,
+            elements=[
+                DocumentElement(type="paragraph", text="  padded text\n"),
+                DocumentElement(type="paragraph", text="   "),
+            ],
+        )
+        section = DocumentSection(
+            title="Main Section",
+            level=1,
+            elements=[DocumentElement(type="paragraph", text="Main content")],
+            subsections=[subsection, DocumentSection(title="", level=2)],
+        )
+        document = ParsedDocument(
+            title="Test Doc",
+            document_id="doc-id",
+            sections=[section, DocumentSection(title="", level=0)],
+        )
+
+        assert section.char_count() == len(section.get_full_text())
+        assert document.char_count() == len(document.get_full_text())
+        assert ParsedDocument(title="", document_id="doc-id").char_count() == 0
+
+    def test_word_count_matches_full_text(self):
+        """Test that word counts match splitting the full text."""
+        subsection = DocumentSection(
+            title="Sub section",
+            level=2,
+            elements=[DocumentElement(type="paragraph", text="  three more words\n")],
+        )
+        section = DocumentSection(
+            title="Main Section",
+            level=1,
+            elements=[DocumentElement(type="paragraph", text="Main content here")],
+            subsections=[subsection],
+        )
+        document = ParsedDocument(title="Test Doc", document_id="doc-id", sections=[section])
+
+        assert section.word_count() == len(section.get_full_text().split()) == 10
+        assert document.word_count() == len(document.get_full_text().split()) == 12
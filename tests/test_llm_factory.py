@@ -1,11 +1,12 @@
 """Tests for LLM factory functions."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
 from app.config import LLMProvider as LLMProviderEnum
-from app.llm.factory import create_embedding_provider, create_llm_provider
+from app.llm.factory import clear_provider_cache, create_embedding_provider, create_llm_provider
 from app.llm.ollama import OllamaProvider
 from app.llm.openai import OpenAIProvider
 
@@ -13,6 +14,13 @@ from app.llm.openai import OpenAIProvider
 class TestLLMFactory:
     """Test LLM factory functions."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_provider_cache(self):
+        """Start every test without providers cached by earlier tests."""
+        clear_provider_cache()
+        yield
+        clear_provider_cache()
+
     @patch("app.llm.factory.get_settings")
     def test_create_ollama_provider(self, mock_get_settings):
         """Test creating Ollama provider."""
@@ -68,3 +76,67 @@ class TestLLMFactory:
 
         provider = create_embedding_provider()
         assert isinstance(provider, OllamaProvider)
+
+    @patch("app.llm.factory.get_settings")
+    def test_create_llm_provider_reuses_instance(self, mock_get_settings):
+        """Test that unchanged settings return the cached provider."""
+        mock_settings = mock_get_settings.return_value
+        mock_settings.llm_provider = LLMProviderEnum.OLLAMA
+        mock_settings.ollama_host = "http://test:11434"
+        mock_settings.ollama_model = "llama3.2"
+
+        provider = create_llm_provider()
+        assert create_llm_provider() is provider
+
+        mock_settings.ollama_model = "llama3.1"
+        assert create_llm_provider() is not provider
+
+    @patch("app.llm.factory.get_settings")
+    def test_create_llm_provider_caches_per_event_loop(self, mock_get_settings):
+        """Test that each event loop gets its own cached provider."""
+        mock_settings = mock_get_settings.return_value
+        mock_settings.llm_provider = LLMProviderEnum.OLLAMA
+        mock_settings.ollama_host = "http://test:11434"
+        mock_settings.ollama_model = "llama3.2"
+
+        async def create_twice():
+            provider = create_llm_provider()
+            assert create_llm_provider() is provider
+            return provider
+
+        first = asyncio.run(create_twice())
+        second = asyncio.run(create_twice())
+        assert first is not second
+        assert create_llm_provider() not in (first, second)
+
+    @patch("app.llm.factory.get_settings")
+    def test_cached_provider_survives_context_exit(self, mock_get_settings):
+        """Test that async with on a cached provider leaves it open for later callers."""
+        mock_settings = mock_get_settings.return_value
+        mock_settings.llm_provider = LLMProviderEnum.OLLAMA
+        mock_settings.ollama_host = "http://test:11434"
+        mock_settings.ollama_model = "llama3.2"
+
+        provider = create_llm_provider()
+
+        async def enter_and_exit(provider):
+            async with provider:
+                pass
+
+        asyncio.run(enter_and_exit(provider))
+        assert not provider.is_closed
+        assert create_llm_provider() is provider
+
+    @patch("app.llm.factory.get_settings")
+    def test_closed_provider_is_replaced(self, mock_get_settings):
+        """Test that a cached provider closed with aclose() is not handed out again."""
+        mock_settings = mock_get_settings.return_value
+        mock_settings.llm_provider = LLMProviderEnum.OLLAMA
+        mock_settings.ollama_host = "http://test:11434"
+        mock_settings.ollama_model = "llama3.2"
+
+        provider = create_llm_provider()
+        asyncio.run(provider.aclose())
+
+        assert provider.is_closed
+        assert create_llm_provider() is not provider
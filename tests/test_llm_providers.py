@@ -47,6 +47,11 @@ class TestOllamaProvider:
         config = OllamaConfig(host="http://test:11434")
         return OllamaProvider(config=config)
 
+    def test_client_timeouts(self, ollama_provider):
+        """Test that the shared HTTP client fails fast on connect but waits for responses."""
+        assert ollama_provider.client.timeout.connect == 5.0
+        assert ollama_provider.client.timeout.read == 30
+
     @pytest.mark.asyncio
     async def test_generate_embedding_success(self, ollama_provider):
         """Test successful embedding generation."""
@@ -61,6 +66,35 @@ class TestOllamaProvider:
             assert result.embedding == [0.1, 0.2, 0.3, 0.4]
             assert result.model == "nomic-embed-text"
 
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_preserves_order(self, ollama_provider):
+        """Test that batch embedding sends one request per batch and keeps input order."""
+
+        def fake_post(url, json):
+            response = MagicMock()
+            response.raise_for_status.return_value = None
+            response.json.return_value = {
+                "embeddings": [[float(len(text))] for text in json["input"]]
+            }
+            return response
+
+        with patch.object(ollama_provider.client, "post", side_effect=fake_post) as mock_post:
+            results = await ollama_provider.generate_embeddings(["a", "bbb", "cc"], batch_size=2)
+
+        assert mock_post.call_count == 2
+        assert [r.embedding for r in results] == [[1.0], [3.0], [2.0]]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_count_mismatch(self, ollama_provider):
+        """Test that a reply with the wrong number of embeddings is rejected."""
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"embeddings": [[0.1]]}
+
+        with patch.object(ollama_provider.client, "post", return_value=mock_response):
+            with pytest.raises(RuntimeError, match="1 embeddings for 2 texts"):
+                await ollama_provider.generate_embeddings(["a", "b"])
+
     @pytest.mark.asyncio
     async def test_generate_response_success(self, ollama_provider):
         """Test successful response generation."""
@@ -80,6 +114,60 @@ class TestOllamaProvider:
             assert result.model == "llama3.2"
             assert result.token_count == 50
 
+    @pytest.mark.asyncio
+    async def test_generate_response_stream(self, ollama_provider):
+        """Test that streamed tokens are yielded as they arrive."""
+        lines = [
+            '{"response": "Hello", "done": false}',
+            "",
+            '{"response": " world", "done": false}',
+            '{"response": "", "done": true, "done_reason": "stop"}',
+        ]
+
+        async def aiter_lines():
+            for line in lines:
+                yield line
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.aiter_lines = aiter_lines
+        mock_stream = MagicMock()
+        mock_stream.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_stream.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(ollama_provider.client, "stream", return_value=mock_stream) as stream:
+            chunks = [chunk async for chunk in ollama_provider.generate_response_stream("hi")]
+
+        assert chunks == ["Hello", " world"]
+        assert stream.call_args.kwargs["json"]["stream"] is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("line", "match"),
+        [
+            ('{"error": "model not found"}', "model not found"),
+            ("not json", "Invalid JSON"),
+        ],
+    )
+    async def test_generate_response_stream_errors(self, ollama_provider, line, match):
+        """Test that error payloads and malformed lines fail the stream."""
+
+        async def aiter_lines():
+            yield '{"response": "Hello", "done": false}'
+            yield line
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.aiter_lines = aiter_lines
+        mock_stream = MagicMock()
+        mock_stream.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_stream.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(ollama_provider.client, "stream", return_value=mock_stream):
+            with pytest.raises(RuntimeError, match=match):
+                async for _ in ollama_provider.generate_response_stream("hi"):
+                    pass
+
     @pytest.mark.asyncio
     async def test_generate_response_with_context(self, ollama_provider):
         """Test response generation with context."""
@@ -113,6 +201,14 @@ class TestOllamaProvider:
             result = await ollama_provider.health_check()
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self, ollama_provider):
+        """Test that leaving the async context closes the HTTP client."""
+        with patch.object(ollama_provider.client, "aclose", new_callable=AsyncMock) as mock_close:
+            async with ollama_provider as provider:
+                assert provider is ollama_provider
+            mock_close.assert_awaited_once()
+
 
 class TestOpenAIProvider:
     """Test OpenAI provider."""
@@ -146,6 +242,26 @@ class TestOpenAIProvider:
             assert result.model == "text-embedding-3-small"
             assert result.token_count == 10
 
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_single_request(self, openai_provider):
+        """Test that a batch of texts is embedded with one API request."""
+        mock_response = MagicMock()
+        # Results may arrive out of order; each carries the index of its input
+        mock_response.data = [MagicMock(embedding=[float(i)], index=i) for i in (2, 0, 1)]
+
+        with patch.object(
+            openai_provider.client.embeddings,
+            "create",
+            new_callable=AsyncMock,
+            return_value=mock_response,
+        ) as mock_create:
+            results = await openai_provider.generate_embeddings(["a", "b", "c"])
+
+        mock_create.assert_awaited_once()
+        assert mock_create.call_args.kwargs["input"] == ["a", "b", "c"]
+        assert [r.embedding for r in results] == [[0.0], [1.0], [2.0]]
+        assert all(isinstance(r, EmbeddingResult) for r in results)
+
     @pytest.mark.asyncio
     async def test_generate_response_success(self, openai_provider):
         """Test successful response generation."""
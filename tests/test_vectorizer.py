@@ -0,0 +1,145 @@
+"""Tests for the vector database integration."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.chunking.models import Chunk, ChunkMetadata
+from app.embedding.indexer import DocumentIndexer
+from app.embedding.vectorizer import ChromaVectorDatabase
+from app.llm.base import EmbeddingResult
+
+
+class TestChromaVectorDatabase:
+    """Test ChromaDB vector database."""
+
+    @pytest.fixture
+    def vector_db(self):
+        """Create a ChromaDB wrapper around a mocked HTTP client."""
+        with patch("app.embedding.vectorizer.chromadb.HttpClient"):
+            return ChromaVectorDatabase(host="localhost", port=8000)
+
+    @pytest.mark.asyncio
+    async def test_add_chunks_single_bulk_call(self, vector_db):
+        """Test that all chunks are written with one collection.add call."""
+        collection = MagicMock()
+        vector_db.client.get_collection.return_value = collection
+        chunks = [
+            Chunk(
+                content=f"Chunk {i} content",
+                embedding=[0.1 * i, 0.2, 0.3],
+                metadata=ChunkMetadata(source_document_id="doc-id", source_tab="Tab"),
+            )
+            for i in range(5)
+        ]
+
+        await vector_db.add_chunks("test_collection", chunks)
+
+        collection.add.assert_called_once()
+        kwargs = collection.add.call_args.kwargs
+        assert len(kwargs["ids"]) == 5
+        assert kwargs["documents"] == [chunk.content for chunk in chunks]
+        assert kwargs["metadatas"][0]["source_tab"] == "Tab"
+
+    @pytest.mark.asyncio
+    async def test_add_chunks_skips_missing_embeddings(self, vector_db):
+        """Test that chunks without embeddings are left out of the bulk add."""
+        collection = MagicMock()
+        vector_db.client.get_collection.return_value = collection
+        chunks = [
+            Chunk(content="Embedded", embedding=[0.1, 0.2]),
+            Chunk(content="Not embedded"),
+        ]
+
+        await vector_db.add_chunks("test_collection", chunks)
+
+        collection.add.assert_called_once()
+        assert collection.add.call_args.kwargs["documents"] == ["Embedded"]
+
+
+class TestDocumentIndexer:
+    """Test document indexing pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_one_call_per_batch(self):
+        """Test that each batch is embedded with a single provider call."""
+        llm_provider = MagicMock()
+        llm_provider.generate_embeddings = AsyncMock(
+            side_effect=lambda texts: [
+                EmbeddingResult(embedding=[float(len(text))], model="test-model") for text in texts
+            ]
+        )
+        indexer = DocumentIndexer(vector_db=MagicMock(), llm_provider=llm_provider)
+        chunks = [Chunk(content=f"Chunk {i}") for i in range(5)]
+        chunks[0].summary = "Summary"
+
+        result = await indexer._generate_embeddings_batch(chunks, batch_size=3)
+
+        assert llm_provider.generate_embeddings.await_count == 2
+        batches = [call.args[0] for call in llm_provider.generate_embeddings.await_args_list]
+        assert batches == [["Chunk 1", "Chunk 2", "Chunk 3"], ["Chunk 4", "Summary\n\nChunk 0"]]
+        assert result == chunks
+        assert [chunk.embedding for chunk in result] == [[16.0]] + [[7.0]] * 4
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_bounds_inflight_batches(self):
+        """Test that no more than max_inflight batches are embedded at once."""
+        inflight = 0
+        peak = 0
+
+        async def fake_embeddings(texts):
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0)
+            inflight -= 1
+            return [EmbeddingResult(embedding=[1.0], model="test-model") for _ in texts]
+
+        llm_provider = MagicMock()
+        llm_provider.generate_embeddings = AsyncMock(side_effect=fake_embeddings)
+        indexer = DocumentIndexer(vector_db=MagicMock(), llm_provider=llm_provider)
+        chunks = [Chunk(content=f"Chunk {i}") for i in range(10)]
+
+        result = await indexer._generate_embeddings_batch(chunks, batch_size=1, max_inflight=3)
+
+        assert peak == 3
+        assert llm_provider.generate_embeddings.await_count == 10
+        assert [chunk.content for chunk in result] == [chunk.content for chunk in chunks]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_keeps_failed_chunks(self):
+        """Test that chunks whose embedding failed are kept without an embedding."""
+        llm_provider = MagicMock()
+        llm_provider.generate_embeddings = AsyncMock(
+            return_value=[
+                EmbeddingResult(embedding=[0.1], model="test-model"),
+                EmbeddingResult(embedding=[], model="test-model", success=False, error="boom"),
+            ]
+        )
+        indexer = DocumentIndexer(vector_db=MagicMock(), llm_provider=llm_provider)
+        chunks = [Chunk(content="Good"), Chunk(content="Fail")]
+
+        result = await indexer._generate_embeddings_batch(chunks, batch_size=10)
+
+        assert [chunk.embedding for chunk in result] == [[0.1], None]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_retries_failed_batch_per_chunk(self):
+        """Test that a rejected batch is retried one chunk at a time."""
+
+        async def fake_embedding(text):
+            if text == "Too long":
+                raise RuntimeError("input too long")
+            return EmbeddingResult(embedding=[1.0], model="test-model")
+
+        llm_provider = MagicMock()
+        llm_provider.generate_embeddings = AsyncMock(side_effect=RuntimeError("batch rejected"))
+        llm_provider.generate_embedding = AsyncMock(side_effect=fake_embedding)
+        indexer = DocumentIndexer(vector_db=MagicMock(), llm_provider=llm_provider)
+        chunks = [Chunk(content="Good"), Chunk(content="Too long"), Chunk(content="Fine")]
+
+        result = await indexer._generate_embeddings_batch(chunks, batch_size=10)
+
+        assert llm_provider.generate_embedding.await_count == 3
+        assert [chunk.embedding for chunk in result] == [[1.0], None, [1.0]]